@@ -55,7 +55,7 @@ def build_batter_dataset(
 
     if calculate_pulled_fb:
         print("Calculating Pulled FB% for all player-seasons...")
-        print("  (This may take a while - ~5-10 seconds per player)")
+        print("  (Fetching one league-wide Statcast pull per season)")
 
         calculator = PulledFlyBallCalculator(cache_manager=cache_manager)
 
@@ -65,32 +65,16 @@ def build_batter_dataset(
             if pd.notna(row.get("mlbam_id"))
         ]
 
-        total = len(player_seasons)
-        pulled_fb_results = []
-
-        for i, (player_id, year) in enumerate(player_seasons):
-            if (i + 1) % 50 == 0 or i == 0:
-                print(f"  Processing {i + 1}/{total}...")
-
-            result = calculator.calculate_for_player_season(player_id, year)
-            if result is not None:
-                pulled_fb_results.append(
-                    {
-                        "mlbam_id": player_id,
-                        "season": year,
-                        "pulled_fb_pct": result,
-                    }
-                )
-
-        if pulled_fb_results:
-            pulled_fb_df = pd.DataFrame(pulled_fb_results)
+        pulled_fb_df = calculator.calculate_batch_grouped(player_seasons)
+
+        if not pulled_fb_df.empty:
             dataset = pd.merge(
                 dataset,
                 pulled_fb_df,
                 on=["mlbam_id", "season"],
                 how="left",
             )
-            print(f"  Calculated Pulled FB% for {len(pulled_fb_results)} player-seasons")
+            print(f"  Calculated Pulled FB% for {len(pulled_fb_df)} player-seasons")
 
     output_path = Path("data/processed/batters.parquet")
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -152,7 +136,7 @@ def build_pitcher_dataset(
             if pd.notna(row.get("mlbam_id"))
         ]
 
-        plate_disc_df = calculator.calculate_batch(player_seasons, verbose=True)
+        plate_disc_df = calculator.calculate_batch_grouped(player_seasons, verbose=True)
 
         if not plate_disc_df.empty:
             # Update with raw Statcast values where available,
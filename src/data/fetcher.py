@@ -6,6 +6,7 @@ from pybaseball import (
     statcast_batter_exitvelo_barrels,
     statcast_batter_expected_stats,
     batting_stats,
+    statcast,
     statcast_batter,
 )
 
@@ -89,6 +90,21 @@ class DataFetcher:
         except Exception:
             return pd.DataFrame()
 
+    def get_statcast_season_data(self, year: int) -> pd.DataFrame:
+        """Fetch league-wide pitch-level Statcast data for a full season."""
+        cache_key = f"statcast_season_{year}"
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            data = statcast(f"{year}-03-01", f"{year}-11-30")
+            if data is not None and not data.empty:
+                self.cache.set(cache_key, data)
+            return data if data is not None else pd.DataFrame()
+        except Exception:
+            return pd.DataFrame()
+
     def get_all_statcast_for_year(self, year: int, min_pa: int = 100) -> pd.DataFrame:
         """Fetch and merge all Statcast data for a year."""
         ev_data = self.get_exit_velo_barrels(year, min_pa)
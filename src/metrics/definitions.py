@@ -2,7 +2,9 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Set, List, Optional
+from typing import Any, Callable, Dict, Set, List, Optional, Tuple
+
+import numpy as np
 
 
 class PlayerType(Enum):
@@ -22,6 +24,11 @@ class MetricDefinition:
     display_name: str
     format_str: str = "{:.1f}"
     suffix: str = ""
+    formatter: Callable[[Any], str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Bound once so display code doesn't look up str.format per value
+        self.formatter = self.format_str.format
 
 
 METRIC_DEFINITIONS: Dict[str, MetricDefinition] = {
@@ -198,6 +205,12 @@ BATTER_LOWER_IS_BETTER: Set[str] = {
     "gb_pct",
 }
 
+# Parallel-array (SoA) view of METRIC_DEFINITIONS for vectorized consumers
+BATTER_METRIC_NAMES = tuple(METRIC_DEFINITIONS)
+BATTER_WEIGHTS_ARR = np.fromiter(
+    (m.weight for m in METRIC_DEFINITIONS.values()), dtype=np.float64
+)
+
 
 @dataclass
 class MetricConfig:
@@ -211,6 +224,8 @@ class MetricConfig:
     sanity_check_tolerance: float
     lower_is_better: Set[str]
     result_stats: List[str] = field(default_factory=list)
+    metric_names: Tuple[str, ...] = ()
+    metric_weights_arr: Optional[np.ndarray] = None
 
     @property
     def dataset_filename(self) -> str:
@@ -240,6 +255,8 @@ def get_metric_config(player_type: PlayerType) -> MetricConfig:
             sanity_check_tolerance=SANITY_CHECK_TOLERANCE,
             lower_is_better=BATTER_LOWER_IS_BETTER,
             result_stats=["G", "PA", "AVG", "OBP", "SLG", "OPS", "wRC+"],
+            metric_names=BATTER_METRIC_NAMES,
+            metric_weights_arr=BATTER_WEIGHTS_ARR,
         )
     else:
         # Import pitcher definitions here to avoid circular imports
@@ -250,6 +267,8 @@ def get_metric_config(player_type: PlayerType) -> MetricConfig:
             PITCHER_SANITY_CHECK_METRIC,
             PITCHER_SANITY_CHECK_TOLERANCE,
             PITCHER_LOWER_IS_BETTER,
+            PITCHER_METRIC_NAMES,
+            PITCHER_WEIGHTS_ARR,
         )
         return MetricConfig(
             player_type=PlayerType.PITCHER,
@@ -260,4 +279,6 @@ def get_metric_config(player_type: PlayerType) -> MetricConfig:
             sanity_check_tolerance=PITCHER_SANITY_CHECK_TOLERANCE,
             lower_is_better=PITCHER_LOWER_IS_BETTER,
             result_stats=["G", "GS", "IP", "ERA", "W", "L", "K", "BB", "WHIP", "FIP", "WAR"],
+            metric_names=PITCHER_METRIC_NAMES,
+            metric_weights_arr=PITCHER_WEIGHTS_ARR,
         )
@@ -2,6 +2,8 @@
 
 from typing import Dict
 
+import numpy as np
+
 from .definitions import MetricDefinition
 
 
@@ -84,6 +86,12 @@ PITCH_METRIC_WEIGHTS: Dict[str, float] = {
     metric.name: metric.weight for metric in PITCH_METRIC_DEFINITIONS.values()
 }
 
+# Parallel-array (SoA) view of PITCH_METRIC_DEFINITIONS for vectorized consumers
+PITCH_METRIC_NAMES = tuple(PITCH_METRIC_DEFINITIONS)
+PITCH_WEIGHTS_ARR = np.fromiter(
+    (m.weight for m in PITCH_METRIC_DEFINITIONS.values()), dtype=np.float64
+)
+
 # Metrics used for similarity comparison (xSLG/xwOBA excluded — too noisy per pitch type)
 PITCH_COMPARISON_METRICS = [
     "avg_velo",
@@ -3,6 +3,8 @@
 from dataclasses import dataclass
 from typing import Dict, Set
 
+import numpy as np
+
 from .definitions import MetricDefinition
 
 
@@ -239,3 +241,9 @@ VOLUME_METRICS = [
 STARTER_IP_THRESHOLD = 100.0  # Legacy, kept for reference
 STARTER_GS_RATIO = 0.5  # GS/G >= 0.5 → classified as starter
 MIN_STARTER_COMP_IP = 80.0  # Minimum IP to be a valid starter comp candidate
+
+# Parallel-array (SoA) view of PITCHER_METRIC_DEFINITIONS for vectorized consumers
+PITCHER_METRIC_NAMES = tuple(PITCHER_METRIC_DEFINITIONS)
+PITCHER_WEIGHTS_ARR = np.fromiter(
+    (m.weight for m in PITCHER_METRIC_DEFINITIONS.values()), dtype=np.float64
+)
@@ -1,9 +1,14 @@
 """Calculate pitcher plate discipline metrics from raw Statcast pitch data."""
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from typing import Optional, Dict
+import numpy as np
 import pandas as pd
 from pybaseball import statcast_pitcher
 
+from ..data.fetcher import DataFetcher
 from ..data.cache_manager import CacheManager
 
 
@@ -40,8 +45,41 @@ class PitcherPlateDisciplineCalculator:
     # Zones 11-14 are outside the strike zone
     OUT_ZONE = [11, 12, 13, 14]
 
-    def __init__(self, cache_manager: Optional[CacheManager] = None):
+    # ndarray copies of the lists above, so np.isin doesn't rebuild them per call
+    _SWING_EVENTS_ARR = np.array(SWING_EVENTS, dtype=object)
+    _WHIFF_EVENTS_ARR = np.array(WHIFF_EVENTS, dtype=object)
+    _CONTACT_EVENTS_ARR = np.array(CONTACT_EVENTS, dtype=object)
+    _IN_ZONE_ARR = np.array(IN_ZONE, dtype=np.float64)
+    _OUT_ZONE_ARR = np.array(OUT_ZONE, dtype=np.float64)
+
+    # Concurrent per-pitcher fetches in calculate_batch (network-bound)
+    MAX_WORKERS = 8
+    # Seconds to wait on a single pitcher-season fetch
+    FETCH_TIMEOUT = 30
+
+    def __init__(
+        self,
+        cache_manager: Optional[CacheManager] = None,
+        fetcher: Optional[DataFetcher] = None,
+    ):
         self.cache = cache_manager or CacheManager()
+        self.fetcher = fetcher or DataFetcher(self.cache)
+
+    @staticmethod
+    def _result_cache_key(player_id: int, season: int) -> str:
+        """Cache key for one pitcher-season's calculated metrics."""
+        return f"pitcher_plate_discipline_v1_{player_id}_{season}"
+
+    def _get_cached_result(self, player_id: int, season: int) -> Optional[Dict[str, float]]:
+        """Previously calculated metrics for a pitcher-season, if cached."""
+        cached = self.cache.get(self._result_cache_key(player_id, season))
+        if cached is not None and not cached.empty:
+            return cached.iloc[0].to_dict()
+        return None
+
+    def _set_cached_result(self, player_id: int, season: int, metrics: Dict[str, float]) -> None:
+        """Store calculated metrics for a pitcher-season."""
+        self.cache.set(self._result_cache_key(player_id, season), pd.DataFrame([metrics]))
 
     def _get_pitch_data(self, player_id: int, season: int) -> pd.DataFrame:
         """Fetch pitch-level data for a pitcher-season."""
@@ -50,34 +88,28 @@ class PitcherPlateDisciplineCalculator:
         if cached is not None:
             return cached
 
+        # Run the fetch on its own thread so a hung request can be abandoned
+        # after FETCH_TIMEOUT (works from calculate_batch workers, unlike SIGALRM)
+        executor = ThreadPoolExecutor(max_workers=1)
         try:
-            import signal
-
-            def timeout_handler(signum, frame):
-                raise TimeoutError("Request timed out")
-
-            # Set 30 second timeout
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(30)
-
-            try:
-                # Fetch full season of pitch data
-                start_dt = f"{season}-03-01"
-                end_dt = f"{season}-11-30"
-                data = statcast_pitcher(start_dt, end_dt, player_id)
-            finally:
-                signal.alarm(0)  # Cancel the alarm
+            # Fetch full season of pitch data
+            start_dt = f"{season}-03-01"
+            end_dt = f"{season}-11-30"
+            future = executor.submit(statcast_pitcher, start_dt, end_dt, player_id)
+            data = future.result(timeout=self.FETCH_TIMEOUT)
 
             if data is not None and not data.empty:
                 self.cache.set(cache_key, data)
                 return data
             return pd.DataFrame()
-        except TimeoutError:
+        except FuturesTimeoutError:
             print(f"Timeout fetching pitch data for {player_id} {season}")
             return pd.DataFrame()
         except Exception as e:
             print(f"Error fetching pitch data for {player_id} {season}: {e}")
             return pd.DataFrame()
+        finally:
+            executor.shutdown(wait=False)
 
     def calculate_for_player_season(
         self, player_id: int, season: int
@@ -91,8 +123,20 @@ class PitcherPlateDisciplineCalculator:
             - zone_contact_pct: % of in-zone swings that result in contact
             - whiff_pct: % of swings that are whiffs (swinging strikes)
         """
+        cached = self._get_cached_result(player_id, season)
+        if cached is not None:
+            return cached
+
         pitches = self._get_pitch_data(player_id, season)
+        metrics = self._calculate_from_pitches(pitches)
+        if metrics is not None:
+            self._set_cached_result(player_id, season, metrics)
+        return metrics
 
+    def _calculate_from_pitches(
+        self, pitches: pd.DataFrame
+    ) -> Optional[Dict[str, float]]:
+        """Calculate plate discipline metrics from one pitcher-season of pitches."""
         if pitches.empty:
             return None
 
@@ -100,49 +144,36 @@ class PitcherPlateDisciplineCalculator:
         if total_pitches == 0:
             return None
 
-        # Classify pitches by zone
-        def is_in_zone(zone):
-            return zone in self.IN_ZONE if pd.notna(zone) else False
-
-        def is_out_zone(zone):
-            return zone in self.OUT_ZONE if pd.notna(zone) else False
-
-        pitches_in_zone = pitches[pitches['zone'].apply(is_in_zone)]
-        pitches_out_zone = pitches[pitches['zone'].apply(is_out_zone)]
+        # Classify each pitch once; metrics below combine these masks
+        zone = pitches['zone'].to_numpy(dtype=float, na_value=np.nan)
+        desc = pitches['description'].to_numpy()
+        in_zone = np.isin(zone, self._IN_ZONE_ARR)
+        out_zone = np.isin(zone, self._OUT_ZONE_ARR)
+        is_swing = np.isin(desc, self._SWING_EVENTS_ARR)
+        is_whiff = np.isin(desc, self._WHIFF_EVENTS_ARR)
+        is_contact = np.isin(desc, self._CONTACT_EVENTS_ARR)
+
+        # Every count the rates need, each a single pass over the masks
+        n_in_zone = int(in_zone.sum())
+        n_out_zone = int(out_zone.sum())
+        n_swing = int(is_swing.sum())
+        n_whiff = int(is_whiff.sum())
+        n_swing_out = int((is_swing & out_zone).sum())
+        swings_in_zone = is_swing & in_zone
+        n_swing_in = int(swings_in_zone.sum())
+        n_contact_in = int((swings_in_zone & is_contact).sum())
 
         # Zone% = pitches in zone / total pitches
-        zone_pct = len(pitches_in_zone) / total_pitches * 100
-
-        # Get swings
-        all_swings = pitches[pitches['description'].isin(self.SWING_EVENTS)]
-        total_swings = len(all_swings)
+        zone_pct = n_in_zone / total_pitches * 100
 
         # Whiff% = whiffs / swings
-        whiffs = pitches[pitches['description'].isin(self.WHIFF_EVENTS)]
-        whiff_pct = len(whiffs) / total_swings * 100 if total_swings > 0 else 0
+        whiff_pct = n_whiff / n_swing * 100 if n_swing > 0 else 0
 
         # Chase% = swings outside zone / pitches outside zone
-        swings_out_zone = pitches_out_zone[
-            pitches_out_zone['description'].isin(self.SWING_EVENTS)
-        ]
-        chase_pct = (
-            len(swings_out_zone) / len(pitches_out_zone) * 100
-            if len(pitches_out_zone) > 0
-            else 0
-        )
+        chase_pct = n_swing_out / n_out_zone * 100 if n_out_zone > 0 else 0
 
         # Z-Contact% = contact on in-zone swings / in-zone swings
-        swings_in_zone = pitches_in_zone[
-            pitches_in_zone['description'].isin(self.SWING_EVENTS)
-        ]
-        contact_in_zone = swings_in_zone[
-            swings_in_zone['description'].isin(self.CONTACT_EVENTS)
-        ]
-        zone_contact_pct = (
-            len(contact_in_zone) / len(swings_in_zone) * 100
-            if len(swings_in_zone) > 0
-            else 0
-        )
+        zone_contact_pct = n_contact_in / n_swing_in * 100 if n_swing_in > 0 else 0
 
         return {
             'zone_pct': round(zone_pct, 1),
@@ -164,19 +195,85 @@ class PitcherPlateDisciplineCalculator:
         Returns:
             DataFrame with mlbam_id, season, and calculated metrics
         """
-        results = []
+        found = self._calculate_threaded(player_seasons, verbose)
+
+        results = [
+            {'mlbam_id': player_id, 'season': season, **found[(player_id, season)]}
+            for player_id, season in player_seasons
+            if found.get((player_id, season)) is not None
+        ]
+
+        return pd.DataFrame(results)
+
+    def _calculate_threaded(self, player_seasons: list, verbose: bool) -> dict:
+        """Per-pitcher fetch + calculate across MAX_WORKERS threads, keyed by (player_id, season)."""
+        found = {}
         total = len(player_seasons)
 
-        for i, (player_id, season) in enumerate(player_seasons):
-            if verbose and ((i + 1) % 25 == 0 or i == 0):
-                print(f"  Calculating plate discipline {i + 1}/{total}...")
-
-            metrics = self.calculate_for_player_season(player_id, season)
-            if metrics is not None:
-                results.append({
-                    'mlbam_id': player_id,
-                    'season': season,
-                    **metrics,
-                })
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(self.calculate_for_player_season, player_id, season): (player_id, season)
+                for player_id, season in player_seasons
+            }
+            for i, future in enumerate(as_completed(futures)):
+                if verbose and ((i + 1) % 25 == 0 or i == 0):
+                    print(f"  Calculating plate discipline {i + 1}/{total}...")
+                found[futures[future]] = future.result()
+
+        return found
+
+    def calculate_batch_grouped(
+        self, player_seasons: list, verbose: bool = True
+    ) -> pd.DataFrame:
+        """
+        Calculate plate discipline for multiple pitcher-seasons using one
+        league-wide Statcast pull per season instead of one per pitcher.
+
+        Pitcher-seasons already in the per-pitcher cache are not refetched.
+        If a season-wide pull fails, falls back to per-pitcher fetches.
+
+        Args:
+            player_seasons: List of (player_id, season) tuples
+            verbose: Print progress updates
+
+        Returns:
+            DataFrame with mlbam_id, season, and calculated metrics
+        """
+        found = {}
+        ids_by_season = defaultdict(list)
+        for player_id, season in player_seasons:
+            cached = self._get_cached_result(player_id, season)
+            if cached is not None:
+                found[(player_id, season)] = cached
+            else:
+                ids_by_season[season].append(player_id)
+
+        for season, player_ids in sorted(ids_by_season.items()):
+            if verbose:
+                print(f"  Calculating plate discipline for {season} ({len(player_ids)} pitchers)...")
+
+            season_data = self.fetcher.get_statcast_season_data(season)
+
+            if season_data.empty or "pitcher" not in season_data.columns:
+                fallback = self._calculate_threaded(
+                    [(player_id, season) for player_id in player_ids], verbose
+                )
+                found.update((k, v) for k, v in fallback.items() if v is not None)
+                continue
+
+            season_data = season_data[season_data["pitcher"].isin(player_ids)]
+
+            for player_id, pitches in season_data.groupby("pitcher"):
+                metrics = self._calculate_from_pitches(pitches)
+                if metrics is not None:
+                    player_id = int(player_id)
+                    self._set_cached_result(player_id, season, metrics)
+                    found[(player_id, season)] = metrics
+
+        results = [
+            {'mlbam_id': player_id, 'season': season, **found[(player_id, season)]}
+            for player_id, season in player_seasons
+            if (player_id, season) in found
+        ]
 
         return pd.DataFrame(results)
@@ -1,6 +1,8 @@
 """Calculate Pulled Air Ball percentage from pitch-level Statcast data."""
 
 import math
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 import pandas as pd
 import numpy as np
@@ -23,6 +25,12 @@ class PulledFlyBallCalculator:
     # 17 degrees matches Baseball Savant's pull zone
     PULL_ANGLE_THRESHOLD = 17
 
+    # Non-ground batted ball types (FB, LD, popup)
+    AIR_TYPES = frozenset({"fly_ball", "line_drive", "popup"})
+
+    # Concurrent per-player fetches in calculate_batch (network-bound)
+    MAX_WORKERS = 8
+
     def __init__(
         self,
         fetcher: Optional[DataFetcher] = None,
@@ -31,6 +39,11 @@ class PulledFlyBallCalculator:
         self.cache = cache_manager or CacheManager()
         self.fetcher = fetcher or DataFetcher(self.cache)
 
+    @staticmethod
+    def _result_cache_key(player_id: int, year: int) -> str:
+        """Cache key for one player-season's calculated Pulled Air%."""
+        return f"pulled_air_v4_{player_id}_{year}"
+
     def calculate_spray_angle(self, hc_x: float, hc_y: float) -> float:
         """
         Calculate spray angle from hit coordinates.
@@ -70,7 +83,7 @@ class PulledFlyBallCalculator:
 
     def is_air_ball(self, bb_type: Optional[str]) -> bool:
         """Determine if a batted ball is NOT a ground ball (i.e., FB, LD, or popup)."""
-        return bb_type in ("fly_ball", "line_drive", "popup")
+        return bb_type in self.AIR_TYPES
 
     def calculate_for_player_season(
         self, player_id: int, year: int
@@ -83,7 +96,7 @@ class PulledFlyBallCalculator:
 
         Returns percentage, or None if insufficient data.
         """
-        cache_key = f"pulled_air_v4_{player_id}_{year}"
+        cache_key = self._result_cache_key(player_id, year)
         cached = self.cache.get(cache_key)
         if cached is not None and not cached.empty:
             return cached.iloc[0]["pulled_fb_pct"]
@@ -95,60 +108,85 @@ class PulledFlyBallCalculator:
             player_id, start_date, end_date
         )
 
+        result = self._calculate_from_pitch_data(pitch_data)
+        if result is None:
+            return None
+
+        result_df = pd.DataFrame([{
+            "player_id": player_id,
+            "season": year,
+            **result,
+        }])
+        self.cache.set(cache_key, result_df)
+
+        return result["pulled_fb_pct"]
+
+    def _calculate_from_pitch_data(self, pitch_data: pd.DataFrame) -> Optional[dict]:
+        """
+        Calculate Pulled Air% from one batter-season of pitch-level data.
+
+        Returns dict with pulled_fb_pct, total_bip and pulled_air_count,
+        or None if insufficient data.
+        """
         if pitch_data.empty:
             return None
 
         # Filter to balls in play
-        batted_balls = pitch_data[
-            pitch_data["type"] == "X"
-        ].copy()
+        is_bip = (pitch_data["type"] == "X").to_numpy()
 
-        if batted_balls.empty or len(batted_balls) < 20:
+        if is_bip.sum() < 20:
             return None
 
         # Need hit coordinates for spray angle
-        batted_balls = batted_balls.dropna(subset=["hc_x", "hc_y"])
+        idx = np.flatnonzero(
+            is_bip
+            & pitch_data["hc_x"].notna().to_numpy()
+            & pitch_data["hc_y"].notna().to_numpy()
+        )
 
-        if batted_balls.empty or len(batted_balls) < 20:
+        if len(idx) < 20:
             return None
 
-        total_bip = len(batted_balls)
+        total_bip = len(idx)
 
-        # Calculate spray angle for each batted ball
-        batted_balls["spray_angle"] = batted_balls.apply(
-            lambda row: self.calculate_spray_angle(row["hc_x"], row["hc_y"]),
-            axis=1,
-        )
+        hc_x = pitch_data["hc_x"].to_numpy(dtype=float)[idx]
+        hc_y = pitch_data["hc_y"].to_numpy(dtype=float)[idx]
+        bb_type = pitch_data["bb_type"].to_numpy()[idx]
+        if "stand" in pitch_data.columns:
+            stand = pitch_data["stand"].to_numpy()[idx]
+        else:
+            stand = np.full(total_bip, "R", dtype=object)
+
+        # Spray angle for each batted ball (see calculate_spray_angle)
+        x_adj = hc_x - self.HOME_PLATE_X
+        y_adj = self.HOME_PLATE_Y - hc_y
+        spray_angle = np.where(y_adj > 0, np.degrees(np.arctan2(x_adj, y_adj)), 0.0)
 
         # Get non-ground balls (air balls = FB + LD + popup)
-        batted_balls["is_air"] = batted_balls["bb_type"].apply(self.is_air_ball)
-        air_balls = batted_balls[batted_balls["is_air"]].copy()
+        is_air = pd.Series(bb_type).isin(self.AIR_TYPES).to_numpy()
 
-        if len(air_balls) < 10:
+        if is_air.sum() < 10:
             return None
 
         # Determine if each air ball is pulled based on THAT AT-BAT's stance
         # (important for switch hitters)
-        air_balls["is_pulled"] = air_balls.apply(
-            lambda row: self.is_pulled(row["spray_angle"], row.get("stand", "R")),
-            axis=1,
+        threshold = self.PULL_ANGLE_THRESHOLD
+        is_pulled = np.where(
+            stand == "R",
+            spray_angle < -threshold,
+            (stand == "L") & (spray_angle > threshold),
         )
 
-        pulled_air_count = air_balls["is_pulled"].sum()
+        pulled_air_count = int((is_air & is_pulled).sum())
 
         # Formula: Pulled Air Balls / Total BIP
         pulled_fb_pct = (pulled_air_count / total_bip) * 100
 
-        result_df = pd.DataFrame([{
-            "player_id": player_id,
-            "season": year,
+        return {
             "pulled_fb_pct": pulled_fb_pct,
             "total_bip": total_bip,
             "pulled_air_count": pulled_air_count,
-        }])
-        self.cache.set(cache_key, result_df)
-
-        return pulled_fb_pct
+        }
 
     def calculate_batch(
         self, player_seasons: list[tuple[int, int]]
@@ -162,16 +200,86 @@ class PulledFlyBallCalculator:
         Returns:
             DataFrame with columns: mlbam_id, season, pulled_fb_pct
         """
-        results = []
+        found = self._calculate_threaded(player_seasons)
+
+        results = [
+            {"mlbam_id": player_id, "season": year, "pulled_fb_pct": found[(player_id, year)]}
+            for player_id, year in player_seasons
+            if found.get((player_id, year)) is not None
+        ]
+
+        if not results:
+            return pd.DataFrame(columns=["mlbam_id", "season", "pulled_fb_pct"])
+
+        return pd.DataFrame(results)
+
+    def _calculate_threaded(self, player_seasons: list[tuple[int, int]]) -> dict:
+        """Per-player fetch + calculate across MAX_WORKERS threads, keyed by (player_id, year)."""
+        found = {}
+
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(self.calculate_for_player_season, player_id, year): (player_id, year)
+                for player_id, year in player_seasons
+            }
+            for future in as_completed(futures):
+                found[futures[future]] = future.result()
+
+        return found
+
+    def calculate_batch_grouped(
+        self, player_seasons: list[tuple[int, int]]
+    ) -> pd.DataFrame:
+        """
+        Calculate Pulled Air% for multiple player-seasons using one
+        league-wide Statcast pull per season instead of one per batter.
+
+        Player-seasons already in the per-player cache are not refetched.
+        If a season-wide pull fails, falls back to per-batter fetches.
+
+        Args:
+            player_seasons: List of (player_id, year) tuples
+
+        Returns:
+            DataFrame with columns: mlbam_id, season, pulled_fb_pct
+        """
+        found = {}
+        missing_by_year = defaultdict(list)
 
         for player_id, year in player_seasons:
-            pulled_fb_pct = self.calculate_for_player_season(player_id, year)
-            if pulled_fb_pct is not None:
-                results.append({
-                    "mlbam_id": player_id,
-                    "season": year,
-                    "pulled_fb_pct": pulled_fb_pct,
-                })
+            cached = self.cache.get(self._result_cache_key(player_id, year))
+            if cached is not None and not cached.empty:
+                found[(player_id, year)] = cached.iloc[0]["pulled_fb_pct"]
+            else:
+                missing_by_year[year].append(player_id)
+
+        for year, player_ids in missing_by_year.items():
+            season_data = self.fetcher.get_statcast_season_data(year)
+
+            if season_data.empty or "batter" not in season_data.columns:
+                fallback = self._calculate_threaded([(player_id, year) for player_id in player_ids])
+                found.update((k, v) for k, v in fallback.items() if v is not None)
+                continue
+
+            season_data = season_data[season_data["batter"].isin(player_ids)]
+
+            for player_id, pitch_data in season_data.groupby("batter"):
+                result = self._calculate_from_pitch_data(pitch_data)
+                if result is None:
+                    continue
+
+                player_id = int(player_id)
+                self.cache.set(
+                    self._result_cache_key(player_id, year),
+                    pd.DataFrame([{"player_id": player_id, "season": year, **result}]),
+                )
+                found[(player_id, year)] = result["pulled_fb_pct"]
+
+        results = [
+            {"mlbam_id": player_id, "season": year, "pulled_fb_pct": found[(player_id, year)]}
+            for player_id, year in player_seasons
+            if (player_id, year) in found
+        ]
 
         if not results:
             return pd.DataFrame(columns=["mlbam_id", "season", "pulled_fb_pct"])
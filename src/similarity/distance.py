@@ -1,25 +1,88 @@
 """Weighted Euclidean distance calculation for similarity."""
 
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
 import numpy as np
 import pandas as pd
+from scipy.spatial.distance import cdist
+
+
+class CandidateArrays(NamedTuple):
+    """Per-pool arrays the distance kernels work on (see prepare_arrays)."""
+
+    values: np.ndarray  # float32 z-matrix, NaN where missing
+    present: np.ndarray  # ~isnan(values)
+    present_f: np.ndarray  # present as float32, for matrix products
+    filled: np.ndarray  # values with NaN replaced by 0
+    filled_sq: np.ndarray  # filled ** 2
+    all_present: bool
 
 
 class DistanceCalculator:
     """Calculates weighted Euclidean distance between player-seasons."""
 
-    def __init__(self, weights: Optional[Dict[str, float]] = None):
+    # Candidate pools kept by prepare_candidates before the oldest is evicted
+    MAX_CACHED_POOLS = 8
+
+    def __init__(
+        self,
+        weights: Optional[Dict[str, float]] = None,
+        metric_names: Optional[Sequence[str]] = None,
+        weight_array: Optional[np.ndarray] = None,
+    ):
         """
         Initialize the distance calculator.
 
         Args:
             weights: Dictionary mapping metric names to their weights
+            metric_names: Metric names parallel to weight_array (takes
+                precedence over weights when both arrays are given)
+            weight_array: Metric weights aligned with metric_names
         """
-        self.weights = weights or {}
+        self._cand_cache: Dict[tuple, tuple] = {}
+        if metric_names is not None and weight_array is not None:
+            self._set_weight_arrays(metric_names, weight_array)
+        else:
+            self.set_weights(weights or {})
+
+    @property
+    def weights(self) -> Dict[str, float]:
+        """Metric weights as a name -> weight dictionary."""
+        return dict(zip(self.metric_names, self.weight_array.tolist()))
 
     def set_weights(self, weights: Dict[str, float]) -> None:
         """Set the metric weights."""
-        self.weights = weights
+        self._set_weight_arrays(
+            tuple(weights),
+            np.fromiter(weights.values(), dtype=np.float64, count=len(weights)),
+        )
+
+    def _set_weight_arrays(
+        self, metric_names: Sequence[str], weight_array: np.ndarray
+    ) -> None:
+        """Store weights as parallel name/weight arrays."""
+        self.metric_names = tuple(metric_names)
+        self.weight_array = np.asarray(weight_array, dtype=np.float64)
+        self._weight_index = {name: i for i, name in enumerate(self.metric_names)}
+        self._weight_vectors: Dict[tuple, np.ndarray] = {}
+        self._kernels: Dict[tuple, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {}
+
+    def weight_vector(self, z_columns: List[str]) -> np.ndarray:
+        """
+        Get weights aligned with z_columns (1.0 for unweighted metrics).
+
+        Cached per column list, since callers reuse the same z_columns.
+        """
+        key = tuple(z_columns)
+        vec = self._weight_vectors.get(key)
+        if vec is None:
+            base_cols = [z[:-2] if z.endswith("_z") else z for z in z_columns]
+            positions = [self._weight_index.get(col, -1) for col in base_cols]
+            vec = np.array(
+                [self.weight_array[i] if i >= 0 else 1.0 for i in positions],
+                dtype=np.float64,
+            )
+            self._weight_vectors[key] = vec
+        return vec
 
     def calculate_distance(
         self,
@@ -41,10 +104,7 @@ class DistanceCalculator:
         total_distance = 0.0
         total_weight = 0.0
 
-        for z_col in z_columns:
-            base_col = z_col.replace("_z", "")
-            weight = self.weights.get(base_col, 1.0)
-
+        for z_col, weight in zip(z_columns, self.weight_vector(z_columns)):
             target_val = target.get(z_col)
             candidate_val = candidate.get(z_col)
 
@@ -60,6 +120,121 @@ class DistanceCalculator:
 
         return np.sqrt(total_distance)
 
+    def compile(self, z_columns: List[str]) -> Callable[..., np.ndarray]:
+        """
+        Build a distance kernel specialized to a fixed z-column list.
+
+        The weight vector is resolved once and baked into the kernel, which
+        is cached per column list until the weights change.
+
+        Args:
+            z_columns: List of z-score column names the kernel will receive
+
+        Returns:
+            Function mapping (CandidateArrays, target vector) to distances
+        """
+        key = tuple(z_columns)
+        kernel = self._kernels.get(key)
+        if kernel is not None:
+            return kernel
+
+        weights = self.weight_vector(z_columns).astype(np.float32)
+        use_cdist = len(z_columns) > 0 and weights.sum() > 0
+
+        def kernel(arrays: CandidateArrays, tgt: np.ndarray) -> np.ndarray:
+            tgt_present = ~np.isnan(tgt)
+
+            # Fast path: no missing values, so scipy's C weighted Euclidean applies
+            if use_cdist and arrays.all_present and tgt_present.all():
+                return cdist(
+                    tgt[None, :], arrays.values, metric="euclidean", w=weights
+                ).ravel()
+
+            # NaN in either player drops that metric, as in calculate_distance.
+            # Expand sum(w * (x - t)^2) = sum(w*x^2) - 2*x.(w*t) + sum(w*t^2),
+            # with the target's missing metrics given zero weight, so each
+            # term is a matrix-vector product over the zero-filled matrix.
+            w_eff = np.where(tgt_present, weights, np.float32(0.0))
+            t0 = np.where(tgt_present, tgt, np.float32(0.0))
+
+            total_distance = (
+                arrays.filled_sq @ w_eff
+                - 2.0 * (arrays.filled @ (w_eff * t0))
+                + arrays.present_f @ (w_eff * t0 * t0)
+            ).astype(np.float64)
+            total_weight = arrays.present_f @ w_eff
+
+            distances = np.sqrt(np.maximum(total_distance, 0.0))
+            distances[total_weight == 0] = np.inf
+            return distances
+
+        self._kernels[key] = kernel
+        return kernel
+
+    def prepare_candidates(
+        self, candidates: pd.DataFrame, z_columns: List[str]
+    ) -> CandidateArrays:
+        """
+        Extract and cache a candidate pool's z-score arrays.
+
+        Use when scoring many targets against the same candidates DataFrame;
+        later distance calls on that same object skip the extraction. The
+        DataFrame must not be modified in place while it is cached.
+
+        Args:
+            candidates: DataFrame containing candidate players' z-scores
+            z_columns: List of z-score column names to use
+
+        Returns:
+            CandidateArrays for the pool
+        """
+        return self._candidate_arrays(candidates, z_columns, store=True)
+
+    def prepare_arrays(self, cand_z: np.ndarray) -> CandidateArrays:
+        """
+        Precompute the kernel inputs for a candidate z-matrix.
+
+        Callers that score many targets against one fixed matrix should
+        prepare it once and pass the result to the *_np methods.
+
+        Args:
+            cand_z: Candidates' z-scores, one row per candidate
+
+        Returns:
+            CandidateArrays for the matrix
+        """
+        # float32 is plenty for z-scores: each distance sums only a couple
+        # dozen squared terms, so precision loss stays far below display rounding
+        values = np.ascontiguousarray(cand_z, dtype=np.float32)
+        present = ~np.isnan(values)
+        filled = np.where(present, values, np.float32(0.0))
+        return CandidateArrays(
+            values=values,
+            present=present,
+            present_f=present.astype(np.float32),
+            filled=filled,
+            filled_sq=filled * filled,
+            all_present=bool(present.all()),
+        )
+
+    def _candidate_arrays(
+        self, candidates: pd.DataFrame, z_columns: List[str], store: bool = False
+    ) -> CandidateArrays:
+        """Get candidate arrays from the pool cache, or build them (caching if store)."""
+        key = (id(candidates), tuple(z_columns))
+        cached = self._cand_cache.get(key)
+        if cached is not None and cached[0] is candidates:
+            return cached[1]
+
+        prepared = self.prepare_arrays(
+            candidates.reindex(columns=z_columns).to_numpy(dtype=np.float32)
+        )
+        if store:
+            if len(self._cand_cache) >= self.MAX_CACHED_POOLS:
+                self._cand_cache.pop(next(iter(self._cand_cache)))
+            self._cand_cache[key] = (candidates, prepared)
+        return prepared
+
     def calculate_all_distances(
         self,
         target: pd.Series,
@@ -77,11 +252,132 @@ class DistanceCalculator:
         Returns:
             Series of distances indexed by candidate DataFrame index
         """
-        distances = candidates.apply(
-            lambda row: self.calculate_distance(target, row, z_columns),
-            axis=1,
+        arrays = self._candidate_arrays(candidates, z_columns)
+        tgt = target.reindex(z_columns).to_numpy(dtype=np.float32)
+
+        distances = self.compile(z_columns)(arrays, tgt)
+        return pd.Series(distances, index=candidates.index)
+
+    def top_k(
+        self,
+        target: pd.Series,
+        candidates: pd.DataFrame,
+        z_columns: List[str],
+        k: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k nearest candidates without sorting the whole pool.
+
+        Candidates with infinite distance are excluded. Ties are broken by
+        candidate order, matching DataFrame.nsmallest(keep="first").
+
+        Args:
+            target: Series containing target player's z-scores
+            candidates: DataFrame containing candidate players' z-scores
+            z_columns: List of z-score column names to use
+            k: Number of nearest candidates to return
+
+        Returns:
+            Tuple of (row positions into candidates, distances), nearest first
+        """
+        distances = self.calculate_all_distances(
+            target, candidates, z_columns
+        ).to_numpy()
+        return self._select_nearest(distances, k)
+
+    def calculate_all_distances_np(
+        self,
+        target_z: np.ndarray,
+        candidates: Union[np.ndarray, CandidateArrays],
+        z_columns: List[str],
+    ) -> np.ndarray:
+        """
+        Calculate distances from a target to candidates given as arrays.
+
+        Args:
+            target_z: Target's z-scores, ordered as z_columns
+            candidates: Candidates' z-matrix, or its prepare_arrays result
+            z_columns: Names of the z-score columns, in matrix order
+
+        Returns:
+            Array of distances aligned with the candidate rows
+        """
+        if not isinstance(candidates, CandidateArrays):
+            candidates = self.prepare_arrays(candidates)
+        tgt = np.asarray(target_z, dtype=np.float32)
+        return self.compile(z_columns)(candidates, tgt)
+
+    def top_k_np(
+        self,
+        target_z: np.ndarray,
+        candidates: Union[np.ndarray, CandidateArrays],
+        z_columns: List[str],
+        k: int,
+        mask: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Array version of top_k; see calculate_all_distances_np for arguments.
+
+        Args:
+            mask: Optional boolean row mask; rows outside it are never returned
+
+        Returns:
+            Tuple of (candidate row positions, distances), nearest first
+        """
+        distances = self.calculate_all_distances_np(target_z, candidates, z_columns)
+        if mask is not None:
+            distances[~mask] = np.inf
+        return self._select_nearest(distances, k)
+
+    def top_k_similar(
+        self,
+        target_z: np.ndarray,
+        candidates: Union[np.ndarray, CandidateArrays],
+        z_columns: List[str],
+        k: int,
+        max_distance: float,
+        mask: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        top_k_np plus similarity scores, computed only for the k selected rows.
+
+        Args:
+            max_distance: Maximum distance in the dataset (for normalization)
+
+        Returns:
+            Tuple of (candidate row positions, distances, similarities),
+            nearest first
+        """
+        positions, distances = self.top_k_np(
+            target_z, candidates, z_columns, k, mask=mask
         )
-        return distances
+        similarities = self.distance_to_similarity_vec(distances, max_distance)
+        return positions, distances, similarities
+
+    def _select_nearest(
+        self, distances: np.ndarray, k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Pick the k smallest finite distances, ties broken by position."""
+        finite = np.flatnonzero(np.isfinite(distances))
+        dist = distances[finite]
+
+        if k <= 0 or len(dist) == 0:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float64)
+
+        if k == 1:
+            # argmin returns the first minimum, so ties still go to the earlier row
+            selected = np.array([np.argmin(dist)])
+        elif k < len(dist):
+            kth = dist[np.argpartition(dist, k - 1)[:k]].max()
+            below = np.flatnonzero(dist < kth)
+            ties = np.flatnonzero(dist == kth)[: k - len(below)]
+            selected = np.concatenate([below, ties])
+        else:
+            selected = np.arange(len(dist))
+
+        selected = selected[np.lexsort((selected, dist[selected]))]
+        positions = finite[selected]
+        return positions, distances[positions]
 
     def distance_to_similarity(
         self, distance: float, max_distance: float
@@ -100,3 +396,21 @@ class DistanceCalculator:
             return 100.0
         similarity = (1 - distance / max_distance) * 100
         return max(0.0, min(100.0, similarity))
+
+    def distance_to_similarity_vec(
+        self, distances: np.ndarray, max_distance: float
+    ) -> np.ndarray:
+        """
+        Vectorized distance_to_similarity for an array of distances.
+
+        Args:
+            distances: Array of calculated distances
+            max_distance: Maximum distance in the dataset (for normalization)
+
+        Returns:
+            Array of similarity scores from 0 to 100
+        """
+        distances = np.asarray(distances, dtype=np.float64)
+        if max_distance == 0:
+            return np.full(distances.shape, 100.0)
+        return np.clip((1.0 - distances / max_distance) * 100.0, 0.0, 100.0)
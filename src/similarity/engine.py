@@ -1,6 +1,7 @@
 """Main similarity engine for finding comparable player-seasons."""
 
-from typing import List, Optional, Dict, Any
+import functools
+from typing import List, Optional, Dict, Any, Tuple
 import pandas as pd
 import numpy as np
 
@@ -37,7 +38,12 @@ class SimilarityEngine:
             xwoba_tolerance: Maximum sanity check metric difference for valid comparisons
             config: MetricConfig for player-type-specific settings (defaults to BATTER)
         """
-        self.dataset = dataset.copy()
+        # Positional index: row i of the dataset is row i of the z-matrix
+        self.dataset = dataset.reset_index(drop=True)
+        # Arrow-backed names so lowercasing/substring search use compiled kernels
+        for col in ("first_name", "last_name"):
+            if col in self.dataset.columns:
+                self.dataset[col] = self.dataset[col].astype("string[pyarrow]")
         self.config = config or get_metric_config(PlayerType.BATTER)
 
         self.weights = weights or self.config.metric_weights
@@ -49,13 +55,23 @@ class SimilarityEngine:
         self.is_batter = self.config.player_type == PlayerType.BATTER
 
         self.normalizer = MetricNormalizer()
-        self.distance_calc = DistanceCalculator(self.weights)
+        if weights is None and self.config.metric_weights_arr is not None:
+            self.distance_calc = DistanceCalculator(
+                metric_names=self.config.metric_names,
+                weight_array=self.config.metric_weights_arr,
+            )
+        else:
+            self.distance_calc = DistanceCalculator(self.weights)
 
         # Only initialize pulled FB calculator for batters
         self.pulled_fb_calc = None
         if self.is_batter:
             from ..metrics.pulled_flyball import PulledFlyBallCalculator
             self.pulled_fb_calc = PulledFlyBallCalculator()
+            # Memoize on-demand calculations; popular comps repeat across queries
+            self._cached_pulled_fb = functools.lru_cache(maxsize=4096)(
+                self.pulled_fb_calc.calculate_for_player_season
+            )
 
         self._prepare_dataset()
 
@@ -75,20 +91,67 @@ class SimilarityEngine:
             self.dataset, available_metrics
         )
 
-        # Estimate max distance from z-score range instead of computing all pairs
-        z_ranges = []
-        for col in self.z_columns:
-            if col in self.dataset.columns:
-                col_data = self.dataset[col].dropna()
-                if len(col_data) > 0:
-                    z_range = col_data.max() - col_data.min()
-                    z_ranges.append(z_range)
-
-        if z_ranges:
-            total_weight = sum(
-                self.weights.get(c.replace("_z", ""), 1.0) for c in self.z_columns
+        # Dense z-score matrix, row-aligned with the dataset, plus the
+        # distance kernel's precomputed inputs for scoring against all rows
+        self._z_matrix = np.ascontiguousarray(
+            self.dataset[self.z_columns].to_numpy(dtype=np.float32)
+        )
+        self._z_arrays = self.distance_calc.prepare_arrays(self._z_matrix)
+        self._z_present = self._z_arrays.present
+
+        self._extract_hot_columns()
+        self._prepare_pitcher_roles()
+
+        # (mlbam_id, season) -> first dataset row, for single-row lookups
+        keys = list(zip(self._mlbam_ids.tolist(), self._seasons.tolist()))
+        self._row_index = dict(zip(reversed(keys), range(len(keys) - 1, -1, -1)))
+
+        # Player-season list and its lowercased "first last" names, for search
+        cols = ["mlbam_id", "season"]
+        cols += [c for c in ("first_name", "last_name") if c in self.dataset.columns]
+        self._available_players = self.dataset[cols].drop_duplicates()
+
+        self._lower_names = None
+        if {"first_name", "last_name"} <= set(cols):
+            players = self._available_players
+            self._lower_names = (
+                players["first_name"].fillna("").str.lower()
+                + " "
+                + players["last_name"].fillna("").str.lower()
             )
-            avg_range = sum(z_ranges) / len(z_ranges)
+
+        # Candidate eligibility is fixed once the dataset is normalized
+        self._has_enough_metrics = self._compute_metric_coverage()
+
+        # Columns copied into result dicts, pulled out in one to_dict call
+        result_cols = [
+            "mlbam_id", "season", "first_name", "last_name",
+            *self.metrics_used, self.sanity_metric, *self.result_stats,
+        ]
+        self._result_columns = [
+            c for c in dict.fromkeys(result_cols) if c in self.dataset.columns
+        ]
+
+        # Sorted per-season values for percentile lookups via searchsorted
+        pct_metrics = [
+            m for m in dict.fromkeys([*self.metrics_used, self.sanity_metric])
+            if m in self.dataset.columns
+        ]
+        self._pct_tables: Dict[Tuple[int, str], np.ndarray] = {}
+        for season, season_data in self.dataset.groupby("season"):
+            for metric in pct_metrics:
+                values = season_data[metric].dropna().to_numpy(dtype=np.float64)
+                self._pct_tables[(int(season), metric)] = np.sort(values)
+
+        # Estimate max distance from z-score range instead of computing all pairs
+        z_values = self.dataset[self.z_columns].to_numpy(dtype=np.float64)
+        has_data = self._z_present.any(axis=0)
+
+        if has_data.any():
+            z_values = z_values[:, has_data]
+            z_ranges = np.nanmax(z_values, axis=0) - np.nanmin(z_values, axis=0)
+            total_weight = float(self.distance_calc.weight_vector(self.z_columns).sum())
+            avg_range = float(z_ranges.mean())
             self.max_distance = avg_range * (total_weight**0.5) * 1.5
         else:
             self.max_distance = 10.0
@@ -112,253 +175,270 @@ class SimilarityEngine:
         Returns:
             List of dictionaries with similar player info and similarity scores
         """
-        target_mask = (
-            (self.dataset["mlbam_id"] == player_id)
-            & (self.dataset["season"] == season)
-        )
-
-        if not target_mask.any():
+        target_idx = self._row_index.get((player_id, season))
+        if target_idx is None:
             return []
 
-        target = self.dataset[target_mask].iloc[0]
-
-        candidates = self.dataset.copy()
-        candidates = candidates[~target_mask]
-
+        # Candidates are tracked as a row mask; only the top matches are sliced.
+        # Excluding the player's other seasons also excludes the target rows.
         if exclude_same_player:
-            candidates = candidates[candidates["mlbam_id"] != player_id]
+            mask = self._mlbam_ids != player_id
+        else:
+            mask = ~((self._mlbam_ids == player_id) & (self._seasons == season))
 
         # Apply sanity check metric filter
-        if (
-            self.sanity_metric in candidates.columns
-            and self.sanity_metric in target.index
-        ):
-            target_sanity = target[self.sanity_metric]
-            if pd.notna(target_sanity):
-                candidates = candidates[
-                    (candidates[self.sanity_metric] >= target_sanity - self.sanity_tolerance)
-                    & (candidates[self.sanity_metric] <= target_sanity + self.sanity_tolerance)
-                ]
-
-        if candidates.empty:
-            return []
+        if self._sanity_vals is not None:
+            target_sanity = self._sanity_vals[target_idx]
+            if not np.isnan(target_sanity):
+                mask &= (
+                    (self._sanity_vals >= target_sanity - self.sanity_tolerance)
+                    & (self._sanity_vals <= target_sanity + self.sanity_tolerance)
+                )
 
         # Apply pitcher role filter (starters vs relievers)
         if not self.is_batter:
-            candidates = self._filter_by_pitcher_role(target, candidates)
-
-        if candidates.empty:
-            return []
+            role_mask = self._pitcher_role_mask(target_idx)
+            if role_mask is not None:
+                mask &= role_mask
 
         # Filter out candidates missing key metrics
-        candidates = self._filter_candidates_by_metrics(candidates)
+        mask &= self._has_enough_metrics
 
-        if candidates.empty:
+        if not mask.any():
             return []
 
-        distances = self.distance_calc.calculate_all_distances(
-            target, candidates, self.z_columns
+        positions, distances, similarities = self.distance_calc.top_k_similar(
+            self._z_matrix[target_idx],
+            self._z_arrays,
+            self.z_columns,
+            top_n,
+            self.max_distance,
+            mask=mask,
         )
 
-        candidates = candidates.copy()
-        candidates["distance"] = distances
-
-        # Filter out candidates with infinite distance (too many missing values)
-        candidates = candidates[candidates["distance"] < float("inf")]
-
-        if candidates.empty:
+        # No candidates with finite distance (too many missing values)
+        if len(positions) == 0:
             return []
 
-        candidates["similarity"] = candidates["distance"].apply(
-            lambda d: self.distance_calc.distance_to_similarity(d, self.max_distance)
-        )
-
-        top_matches = candidates.nsmallest(top_n, "distance")
+        records = self.dataset.iloc[positions][
+            self._result_columns
+        ].to_dict(orient="records")
 
         results = []
-        for _, row in top_matches.iterrows():
+        for row, similarity, distance in zip(records, similarities, distances):
             result = {
                 "mlbam_id": int(row["mlbam_id"]),
                 "season": int(row["season"]),
-                "similarity": round(row["similarity"], 1),
-                "distance": round(row["distance"], 4),
+                "similarity": round(similarity, 1),
+                "distance": round(distance, 4),
             }
+            results.append(self._build_result(row, result))
 
-            if "first_name" in row and "last_name" in row:
-                result["name"] = f"{row['first_name']} {row['last_name']}"
+        return self._add_percentiles_batch(results)
 
-            for metric in self.metrics_used:
-                if metric in row:
-                    result[metric] = row[metric]
+    def _build_result(
+        self, row: Dict[str, Any], result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Fill a result dict from a dataset record (see _result_columns).
 
-            if self.sanity_metric in row:
-                result[self.sanity_metric] = row[self.sanity_metric]
+        Percentiles are added separately, so results can be ranked in a batch.
+        """
+        if "first_name" in row and "last_name" in row:
+            result["name"] = f"{row['first_name']} {row['last_name']}"
 
-            # Add results stats
-            for stat in self.result_stats:
-                if stat in row and pd.notna(row[stat]):
-                    result[stat] = row[stat]
+        for metric in self.metrics_used:
+            if metric in row:
+                result[metric] = row[metric]
 
-            # Add pulled FB% for batters (calculated on-demand)
-            if self.is_batter:
-                pulled_fb = self._get_pulled_fb_pct(
-                    int(row["mlbam_id"]), int(row["season"])
-                )
-                if pulled_fb is not None:
-                    result["pulled_fb_pct"] = pulled_fb
+        if self.sanity_metric in row:
+            result[self.sanity_metric] = row[self.sanity_metric]
 
-            # Add percentiles
-            result = self._add_percentiles(result)
+        # Add results stats
+        for stat in self.result_stats:
+            if stat in row and pd.notna(row[stat]):
+                result[stat] = row[stat]
 
-            results.append(result)
+        # Add pulled FB% for batters (calculated on-demand)
+        if self.is_batter:
+            pulled_fb = self._get_pulled_fb_pct(result["mlbam_id"], result["season"])
+            if pulled_fb is not None:
+                result["pulled_fb_pct"] = pulled_fb
 
-        return results
+        return result
+
+    def _float_column(self, col: str) -> Optional[np.ndarray]:
+        """Get a dataset column as a float64 array (NaN for missing), or None."""
+        if col not in self.dataset.columns:
+            return None
+        return self.dataset[col].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    def _extract_hot_columns(self) -> None:
+        """Keep numpy copies of the columns read on every query.
+
+        The dataset is read-only after preparation, so these never go stale.
+        """
+        self._mlbam_ids = self.dataset["mlbam_id"].to_numpy()
+        self._seasons = self.dataset["season"].to_numpy()
+        self._sanity_vals = self._float_column(self.sanity_metric)
+        self._pulled_fb = self._float_column("pulled_fb_pct")
+
+    def _prepare_pitcher_roles(self) -> None:
+        """Classify every pitcher-season as starter or reliever by GS/G."""
+        self._games = None
+        if self.is_batter or not {"G", "GS"} <= set(self.dataset.columns):
+            return
+
+        from ..metrics.pitcher_definitions import (
+            STARTER_GS_RATIO,
+            MIN_STARTER_COMP_IP,
+        )
+
+        self._games = self._float_column("G")
+        self._games_started = self._float_column("GS")
+
+        cand_g = np.nan_to_num(self._games)
+        cand_gs = np.nan_to_num(self._games_started)
+        gs_ratio = np.divide(
+            cand_gs, cand_g, out=np.zeros_like(cand_gs), where=cand_g > 0
+        )
+        self._is_starter = (cand_g > 0) & (gs_ratio >= STARTER_GS_RATIO)
 
-    def _filter_candidates_by_metrics(self, candidates: pd.DataFrame) -> pd.DataFrame:
-        """Filter candidates based on having sufficient metrics."""
+        ip = self._float_column("IP")
+        ip = np.nan_to_num(ip) if ip is not None else 0.0
+        self._starter_ip_ok = np.broadcast_to(ip >= MIN_STARTER_COMP_IP, cand_g.shape)
+
+    def _compute_metric_coverage(self) -> np.ndarray:
+        """Flag dataset rows with enough metrics to be a comparison candidate."""
         if self.is_batter:
             # Must have at least 2 batted ball metrics AND 2 plate discipline metrics
-            batted_ball_z = [
-                f"{m}_z"
-                for m in ["exit_velocity", "barrel_pct", "hard_hit_pct", "launch_angle"]
-                if f"{m}_z" in self.z_columns
-            ]
-            plate_disc_z = [
-                f"{m}_z"
-                for m in ["chase_rate", "whiff_pct", "k_pct", "bb_pct"]
-                if f"{m}_z" in self.z_columns
+            groups = [
+                ["exit_velocity", "barrel_pct", "hard_hit_pct", "launch_angle"],
+                ["chase_rate", "whiff_pct", "k_pct", "bb_pct"],
             ]
-
-            bb_counts = (
-                candidates[batted_ball_z].notna().sum(axis=1) if batted_ball_z else 0
-            )
-            pd_counts = (
-                candidates[plate_disc_z].notna().sum(axis=1) if plate_disc_z else 0
-            )
-
-            return candidates[(bb_counts >= 2) & (pd_counts >= 2)]
         else:
             # Pitchers: Must have at least 2 stuff metrics AND 2 control/results metrics
-            stuff_z = [
-                f"{m}_z"
-                for m in ["k_pct", "whiff_pct", "chase_pct", "stuff_plus"]
-                if f"{m}_z" in self.z_columns
-            ]
-            control_z = [
-                f"{m}_z"
-                for m in ["bb_pct", "xfip", "xera", "zone_pct"]
-                if f"{m}_z" in self.z_columns
+            groups = [
+                ["k_pct", "whiff_pct", "chase_pct", "stuff_plus"],
+                ["bb_pct", "xfip", "xera", "zone_pct"],
             ]
 
-            stuff_counts = (
-                candidates[stuff_z].notna().sum(axis=1) if stuff_z else 0
-            )
-            control_counts = (
-                candidates[control_z].notna().sum(axis=1) if control_z else 0
-            )
+        col_pos = {z: i for i, z in enumerate(self.z_columns)}
+        has_enough = np.ones(len(self.dataset), dtype=bool)
+        for group in groups:
+            positions = [col_pos[f"{m}_z"] for m in group if f"{m}_z" in col_pos]
+            counts = self._z_present[:, positions].sum(axis=1)
+            has_enough &= counts >= 2
+        return has_enough
 
-            return candidates[(stuff_counts >= 2) & (control_counts >= 2)]
-
-    def _filter_by_pitcher_role(
-        self, target: pd.Series, candidates: pd.DataFrame
-    ) -> pd.DataFrame:
-        """Filter pitcher candidates to same role (starter vs reliever).
+    def _pitcher_role_mask(self, target_idx: int) -> Optional[np.ndarray]:
+        """Mask of pitchers in the target's role (starter vs reliever).
 
         Role is determined by GS/G ratio (>= 0.5 = starter), not IP.
         A starter with a small sample (e.g. call-up) still comps TO starters,
         but comp candidates must have enough IP to be statistically reliable.
-        """
-        from ..metrics.pitcher_definitions import (
-            STARTER_GS_RATIO,
-            MIN_STARTER_COMP_IP,
-        )
-
-        # Determine target's role from GS/G ratio
-        target_g = target.get("G") if "G" in target.index else None
-        target_gs = target.get("GS") if "GS" in target.index else None
-
-        if target_g is None or pd.isna(target_g) or float(target_g) == 0:
-            return candidates
-        if target_gs is None or pd.isna(target_gs):
-            return candidates
 
-        target_is_starter = (float(target_gs) / float(target_g)) >= STARTER_GS_RATIO
+        Returns None when the target's role can't be determined.
+        """
+        if self._games is None:
+            return None
 
-        # Classify candidates by GS/G ratio
-        if "G" not in candidates.columns or "GS" not in candidates.columns:
-            return candidates
+        target_g = self._games[target_idx]
+        target_gs = self._games_started[target_idx]
 
-        cand_g = candidates["G"].fillna(0).astype(float)
-        cand_gs = candidates["GS"].fillna(0).astype(float)
-        cand_is_starter = (cand_gs / cand_g.replace(0, float("nan"))) >= STARTER_GS_RATIO
+        if np.isnan(target_g) or target_g == 0 or np.isnan(target_gs):
+            return None
 
-        if target_is_starter:
+        if self._is_starter[target_idx]:
             # Target is a starter → comp to starters with enough IP
-            return candidates[
-                cand_is_starter
-                & (candidates["IP"].fillna(0).astype(float) >= MIN_STARTER_COMP_IP)
-            ]
+            return self._is_starter & self._starter_ip_ok
         else:
             # Target is a reliever → comp to relievers
-            return candidates[~cand_is_starter]
+            return ~self._is_starter
 
-    def _calculate_percentile(
-        self, metric: str, value: float, season: int, higher_is_better: bool = True
-    ) -> float:
-        """Calculate percentile for a metric value within a specific season."""
-        if value is None or str(value) == "nan":
-            return 50.0
-
-        if metric not in self.dataset.columns:
-            return 50.0
+    def _calculate_percentiles(
+        self,
+        metric: str,
+        values: List[Any],
+        season: int,
+        higher_is_better: bool = True,
+    ) -> np.ndarray:
+        """Calculate percentiles for several values of one metric in one season.
 
-        # Filter to the specific season only
-        season_data = self.dataset[self.dataset["season"] == season]
-        col_data = season_data[metric].dropna()
+        Missing values (None/NaN) and seasons without data get 50.
+        """
+        values = np.array(values, dtype=np.float64)
+        col_data = self._pct_tables.get((int(season), metric))
 
-        if len(col_data) == 0:
-            return 50.0
+        if col_data is None or len(col_data) == 0:
+            return np.full(values.shape, 50.0)
 
         # Calculate percentile rank within that season
-        pct = (col_data < value).sum() / len(col_data) * 100
+        pct = np.searchsorted(col_data, values, side="left") / len(col_data) * 100
 
         # Flip if lower is better
         if not higher_is_better:
             pct = 100 - pct
 
-        return max(1, min(99, pct))
+        return np.where(np.isnan(values), 50.0, np.clip(pct, 1, 99))
 
     def _add_percentiles(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """Add percentile rankings to a player result (within their season)."""
-        season = result.get("season")
-        if season is None:
-            season = 2024  # fallback
+        return self._add_percentiles_batch([result])[0]
 
-        percentiles = {}
-        for metric in self.metrics_used:
-            if metric in result and result[metric] is not None:
-                higher_is_better = metric not in self.lower_is_better
-                percentiles[f"{metric}_pct"] = self._calculate_percentile(
-                    metric, result[metric], season, higher_is_better
-                )
+    def _add_percentiles_batch(
+        self, results: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Add percentile rankings to several results at once.
 
-        # Add sanity check metric percentile
-        if self.sanity_metric in result:
-            # For batters, xwoba higher is better; for pitchers, xera lower is better
-            higher_is_better = self.sanity_metric not in self.lower_is_better
-            percentiles[f"{self.sanity_metric}_pct"] = self._calculate_percentile(
-                self.sanity_metric, result[self.sanity_metric], season, higher_is_better
-            )
+        Ranks are computed with one searchsorted per (season, metric) rather
+        than one lookup per result per metric.
+        """
+        seasons = [
+            r.get("season") if r.get("season") is not None else 2024  # fallback
+            for r in results
+        ]
+        metrics = list(dict.fromkeys([*self.metrics_used, self.sanity_metric]))
+
+        # Rank every result's value in its season; pos[i] is result i's slot
+        ranks: Dict[Tuple[int, str], List[float]] = {}
+        pos = [0] * len(results)
+        for season in dict.fromkeys(seasons):
+            rows = [i for i, s in enumerate(seasons) if s == season]
+            for j, i in enumerate(rows):
+                pos[i] = j
+            for metric in metrics:
+                # tolist: hand the UI plain floats rather than numpy scalars
+                ranks[(season, metric)] = self._calculate_percentiles(
+                    metric,
+                    [results[i].get(metric) for i in rows],
+                    season,
+                    metric not in self.lower_is_better,
+                ).tolist()
+
+        for i, result in enumerate(results):
+            season = seasons[i]
+            percentiles = {}
+            for metric in self.metrics_used:
+                if metric in result and result[metric] is not None:
+                    percentiles[f"{metric}_pct"] = ranks[(season, metric)][pos[i]]
 
-        # Add pulled_fb_pct percentile for batters (higher is better for power hitters)
-        if self.is_batter and "pulled_fb_pct" in result and result["pulled_fb_pct"] is not None:
-            # Estimate percentile based on typical ranges with 17° threshold
-            val = result["pulled_fb_pct"]
-            pct = min(99, max(1, (val - 8) / 17 * 100))
-            percentiles["pulled_fb_pct_pct"] = pct
+            # Add sanity check metric percentile
+            # (for batters, xwoba higher is better; for pitchers, xera lower is better)
+            if self.sanity_metric in result:
+                percentiles[f"{self.sanity_metric}_pct"] = ranks[
+                    (season, self.sanity_metric)
+                ][pos[i]]
 
-        result["percentiles"] = percentiles
-        return result
+            # Add pulled_fb_pct percentile for batters (higher is better for power hitters)
+            if self.is_batter and "pulled_fb_pct" in result and result["pulled_fb_pct"] is not None:
+                # Estimate percentile based on typical ranges with 17° threshold
+                val = result["pulled_fb_pct"]
+                pct = min(99, max(1, (val - 8) / 17 * 100))
+                percentiles["pulled_fb_pct_pct"] = pct
+
+            result["percentiles"] = percentiles
+
+        return results
 
     def _get_pulled_fb_pct(self, player_id: int, season: int) -> Optional[float]:
         """Get pulled FB% for a player-season, calculating if needed."""
@@ -366,17 +446,15 @@ class SimilarityEngine:
             return None
 
         # Check if already in dataset
-        mask = (self.dataset["mlbam_id"] == player_id) & (
-            self.dataset["season"] == season
-        )
-        if mask.any():
-            row = self.dataset[mask].iloc[0]
-            if "pulled_fb_pct" in row and pd.notna(row["pulled_fb_pct"]):
-                return row["pulled_fb_pct"]
+        row_idx = self._row_index.get((player_id, season))
+        if row_idx is not None and self._pulled_fb is not None:
+            value = self._pulled_fb[row_idx]
+            if not np.isnan(value):
+                return value
 
         # Calculate on-demand
         try:
-            return self.pulled_fb_calc.calculate_for_player_season(player_id, season)
+            return self._cached_pulled_fb(player_id, season)
         except Exception:
             return None
 
@@ -384,67 +462,32 @@ class SimilarityEngine:
         self, player_id: int, season: int
     ) -> Optional[Dict[str, Any]]:
         """Get data for a specific player-season."""
-        mask = (
-            (self.dataset["mlbam_id"] == player_id)
-            & (self.dataset["season"] == season)
-        )
-
-        if not mask.any():
+        row_idx = self._row_index.get((player_id, season))
+        if row_idx is None:
             return None
 
-        row = self.dataset[mask].iloc[0]
+        row = self.dataset.iloc[[row_idx]][self._result_columns].to_dict(
+            orient="records"
+        )[0]
 
         result = {
             "mlbam_id": int(row["mlbam_id"]),
             "season": int(row["season"]),
         }
-
-        if "first_name" in row and "last_name" in row:
-            result["name"] = f"{row['first_name']} {row['last_name']}"
-
-        for metric in self.metrics_used:
-            if metric in row:
-                result[metric] = row[metric]
-
-        if self.sanity_metric in row:
-            result[self.sanity_metric] = row[self.sanity_metric]
-
-        # Add results stats
-        for stat in self.result_stats:
-            if stat in row and pd.notna(row[stat]):
-                result[stat] = row[stat]
-
-        # Add pulled FB% for batters (calculated on-demand)
-        if self.is_batter:
-            pulled_fb = self._get_pulled_fb_pct(int(row["mlbam_id"]), int(row["season"]))
-            if pulled_fb is not None:
-                result["pulled_fb_pct"] = pulled_fb
-
-        # Add percentiles
-        result = self._add_percentiles(result)
-
-        return result
+        return self._add_percentiles(self._build_result(row, result))
 
     def get_available_players(self) -> pd.DataFrame:
         """Get list of all available player-seasons."""
-        cols = ["mlbam_id", "season"]
-        if "first_name" in self.dataset.columns:
-            cols.append("first_name")
-        if "last_name" in self.dataset.columns:
-            cols.append("last_name")
-
-        return self.dataset[cols].drop_duplicates()
+        return self._available_players
 
     def search_players(self, name_query: str) -> pd.DataFrame:
         """Search for players by name."""
-        df = self.get_available_players()
-
-        if "first_name" not in df.columns or "last_name" not in df.columns:
+        if self._lower_names is None:
             return pd.DataFrame()
 
-        query_lower = name_query.lower()
-        mask = df["first_name"].str.lower().str.contains(
-            query_lower, na=False
-        ) | df["last_name"].str.lower().str.contains(query_lower, na=False)
+        mask = self._lower_names.str.contains(
+            name_query.lower(), regex=False
+        ).to_numpy(dtype=bool)
+        df = self._available_players[mask]
 
-        return df[mask].sort_values(["last_name", "first_name", "season"])
+        return df.sort_values(["last_name", "first_name", "season"])
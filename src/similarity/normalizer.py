@@ -13,6 +13,17 @@ class MetricNormalizer:
         self._stds: Dict[str, float] = {}
         self._fitted = False
 
+    @classmethod
+    def from_stats(
+        cls, means: Dict[str, float], stds: Dict[str, float]
+    ) -> "MetricNormalizer":
+        """Build a fitted normalizer from precomputed means and stds."""
+        normalizer = cls()
+        normalizer._means = dict(means)
+        normalizer._stds = dict(stds)
+        normalizer._fitted = True
+        return normalizer
+
     def fit(self, df: pd.DataFrame, columns: List[str]) -> "MetricNormalizer":
         """
         Compute means and standard deviations for normalization.
@@ -24,13 +35,14 @@ class MetricNormalizer:
         Returns:
             self for method chaining
         """
-        for col in columns:
-            if col in df.columns:
-                col_data = df[col].dropna()
-                self._means[col] = col_data.mean()
-                self._stds[col] = col_data.std()
-                if self._stds[col] == 0:
-                    self._stds[col] = 1.0
+        # Column-wise reductions skip NaN, so no per-column dropna is needed
+        data = df[[col for col in columns if col in df.columns]]
+        means = data.mean()
+        stds = data.std()
+        stds = stds.where(stds != 0, 1.0)
+
+        self._means.update(means.to_dict())
+        self._stds.update(stds.to_dict())
 
         self._fitted = True
         return self
@@ -48,18 +60,41 @@ class MetricNormalizer:
         Returns:
             DataFrame with normalized columns (suffixed with '_z')
         """
+        z_df = self.transform_z_only(df, columns)
+        stale = [c for c in z_df.columns if c in df.columns]
+        return pd.concat([df.drop(columns=stale), z_df], axis=1)
+
+    def transform_z_only(
+        self, df: pd.DataFrame, columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Compute z-scores without copying the rest of the DataFrame.
+
+        Args:
+            df: DataFrame to transform
+            columns: List of columns to normalize (defaults to all fitted columns)
+
+        Returns:
+            DataFrame of just the '_z' columns, indexed like df
+        """
         if not self._fitted:
             raise ValueError("Normalizer must be fitted before transforming")
 
-        result = df.copy()
         cols_to_transform = columns or list(self._means.keys())
-
-        for col in cols_to_transform:
-            if col in df.columns and col in self._means:
-                z_col = f"{col}_z"
-                result[z_col] = (df[col] - self._means[col]) / self._stds[col]
-
-        return result
+        cols = [
+            c for c in dict.fromkeys(cols_to_transform)
+            if c in df.columns and c in self._means
+        ]
+        z_cols = [f"{c}_z" for c in cols]
+        if not cols:
+            return pd.DataFrame(index=df.index)
+
+        # One broadcast subtract/divide over all columns at once
+        means = np.array([self._means[c] for c in cols], dtype=np.float64)
+        stds = np.array([self._stds[c] for c in cols], dtype=np.float64)
+        values = df[cols].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        return pd.DataFrame((values - means) / stds, index=df.index, columns=z_cols)
 
     def fit_transform(
         self, df: pd.DataFrame, columns: List[str]
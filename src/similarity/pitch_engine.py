@@ -1,6 +1,7 @@
 """Per-pitch-type similarity engine for the Pitch Model page."""
 
-from typing import Dict, List, Optional, Any
+import functools
+from typing import Dict, List, Optional, Any, Tuple
 import pandas as pd
 import numpy as np
 
@@ -8,6 +9,8 @@ from .normalizer import MetricNormalizer
 from .distance import DistanceCalculator
 from ..metrics.pitch_model_definitions import (
     PITCH_METRIC_WEIGHTS,
+    PITCH_METRIC_NAMES,
+    PITCH_WEIGHTS_ARR,
     PITCH_COMPARISON_METRICS,
     MIN_COMP_PITCHES,
 )
@@ -25,6 +28,11 @@ class PitchSimilarityEngine:
                      containing aggregated pitch metrics.
         """
         self.dataset = dataset.copy()
+        # Narrow key dtypes: pitch-type filters and groupbys run on category
+        # codes, and id/season comparisons touch less memory
+        self.dataset["pitch_type"] = self.dataset["pitch_type"].astype("category")
+        self.dataset["mlbam_id"] = self.dataset["mlbam_id"].astype(np.int32)
+        self.dataset["season"] = self.dataset["season"].astype(np.int16)
         self.weights = PITCH_METRIC_WEIGHTS
         self.metrics = [
             m for m in PITCH_COMPARISON_METRICS if m in self.dataset.columns
@@ -33,48 +41,152 @@ class PitchSimilarityEngine:
         if not self.metrics:
             raise ValueError("Dataset missing all pitch comparison metrics")
 
-        self.distance_calc = DistanceCalculator(self.weights)
+        self.distance_calc = DistanceCalculator(
+            metric_names=PITCH_METRIC_NAMES, weight_array=PITCH_WEIGHTS_ARR
+        )
 
         # Normalize metrics *within each pitch type* so comparisons are fair
         self._normalizers: Dict[str, MetricNormalizer] = {}
         self._z_columns = [f"{m}_z" for m in self.metrics]
         self._normalize_by_pitch_type()
+        self._build_buckets()
+
+        # Engine state is read-only after construction, so per-pitcher results
+        # can be memoized; the UI re-queries the same pitcher on every rerun
+        self._cached_pitches = functools.lru_cache(maxsize=1024)(
+            self._get_pitcher_pitches
+        )
+        self._cached_similar = functools.lru_cache(maxsize=1024)(
+            self._find_similar_pitches
+        )
+        self._cached_info = functools.lru_cache(maxsize=1024)(
+            self._get_pitcher_info
+        )
 
     def _normalize_by_pitch_type(self) -> None:
         """Compute z-scores for each metric grouped by pitch type."""
-        normalized_parts = []
-
-        for pitch_type, group in self.dataset.groupby("pitch_type"):
-            normalizer = MetricNormalizer()
-            available = [m for m in self.metrics if m in group.columns]
-            if not available:
-                normalized_parts.append(group)
-                continue
-
-            normalized = normalizer.fit_transform(group, available)
-            self._normalizers[pitch_type] = normalizer
-            normalized_parts.append(normalized)
+        # Rows without a pitch type can't be grouped (groupby drops them)
+        if self.dataset["pitch_type"].isna().any():
+            self.dataset = self.dataset[self.dataset["pitch_type"].notna()]
+        self.dataset = self.dataset.reset_index(drop=True)
+
+        # Per-pitch-type stats in one grouped pass; rows keep their order
+        grouped = self.dataset.groupby("pitch_type", sort=False, observed=True)
+        means = grouped[self.metrics].mean()
+        stds = grouped[self.metrics].std()
+        stds = stds.where(stds != 0, 1.0)
+
+        for pitch_type in means.index:
+            self._normalizers[pitch_type] = MetricNormalizer.from_stats(
+                means.loc[pitch_type].to_dict(), stds.loc[pitch_type].to_dict()
+            )
 
-        if normalized_parts:
-            self.dataset = pd.concat(normalized_parts, ignore_index=True)
+        # Broadcast each row's group stats by group number
+        group_ids = grouped.ngroup().to_numpy()
+        values = self.dataset[self.metrics].to_numpy(dtype=np.float64, na_value=np.nan)
+        self.dataset[self._z_columns] = pd.DataFrame(
+            (values - means.to_numpy()[group_ids]) / stds.to_numpy()[group_ids],
+            index=self.dataset.index,
+            columns=self._z_columns,
+        )
 
-        # Calculate max distance for similarity scoring
-        z_ranges = []
-        for col in self._z_columns:
-            if col in self.dataset.columns:
-                col_data = self.dataset[col].dropna()
-                if len(col_data) > 0:
-                    z_ranges.append(col_data.max() - col_data.min())
+        # Calculate max distance for similarity scoring, one columnar pass
+        z_df = self.dataset[self._z_columns]
+        z_ranges = (z_df.max() - z_df.min()).dropna().to_numpy()
 
-        if z_ranges:
-            total_weight = sum(
-                self.weights.get(c.replace("_z", ""), 1.0) for c in self._z_columns
-            )
-            avg_range = sum(z_ranges) / len(z_ranges)
+        if len(z_ranges):
+            total_weight = float(self.distance_calc.weight_vector(self._z_columns).sum())
+            avg_range = float(z_ranges.mean())
             self.max_distance = avg_range * (total_weight ** 0.5) * 1.5
         else:
             self.max_distance = 10.0
 
+    def _build_buckets(self) -> None:
+        """Pre-group comp-eligible rows by (pitch_type, is_starter).
+
+        Eligible rows have enough pitches and Stuff+ data. Each pitch type
+        also gets a (pitch_type, None) bucket for targets without a role.
+        """
+        self._mlbam_ids = self.dataset["mlbam_id"].to_numpy()
+        self._z_matrix = np.ascontiguousarray(
+            self.dataset[self._z_columns].to_numpy(dtype=np.float32)
+        )
+        # Columns copied into pitch/match dicts, kept as arrays so a handful
+        # of rows can be gathered without going through pandas
+        record_cols = [
+            "mlbam_id", "season", "first_name", "last_name", "pitch_type",
+            "pitch_name", "n_pitches",
+        ]
+        self._record_arrays: Dict[str, np.ndarray] = {
+            c: self.dataset[c].to_numpy()
+            for c in record_cols
+            if c in self.dataset.columns
+        }
+        # Numeric fields are only copied when present; the NaN scan runs once
+        self._value_columns = [
+            c for c in dict.fromkeys([*self.metrics, "arm_angle"])
+            if c in self.dataset.columns
+        ]
+        self._values = self.dataset[self._value_columns].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        self._values_present = ~np.isnan(self._values)
+
+        # (mlbam_id, season) -> dataset positions, for O(1) pitcher lookups
+        self._by_player_season: Dict[Tuple[int, int], np.ndarray] = (
+            self.dataset.groupby(["mlbam_id", "season"], sort=False).indices
+        )
+
+        self._roles = None
+        if "is_starter" in self.dataset.columns:
+            self._roles = self.dataset["is_starter"].to_numpy()
+
+        eligible = (
+            (self.dataset["n_pitches"] >= MIN_COMP_PITCHES)
+            & self.dataset["stuff_plus"].notna()
+        ).to_numpy()
+
+        self._buckets: Dict[Tuple[str, Optional[bool]], Dict[str, Any]] = {}
+        self._by_pitchtype_indices: Dict[str, np.ndarray] = (
+            self.dataset.groupby("pitch_type", sort=False, observed=True).indices
+        )
+        for pitch_type, rows in self._by_pitchtype_indices.items():
+            rows = rows[eligible[rows]]
+            self._buckets[(pitch_type, None)] = self._make_bucket(rows)
+            if self._roles is not None:
+                for role in (True, False):
+                    role_rows = rows[self._roles[rows] == role]
+                    self._buckets[(pitch_type, role)] = self._make_bucket(role_rows)
+
+    def _make_bucket(self, rows: np.ndarray) -> Dict[str, Any]:
+        """Bundle dataset positions with their ids and prepared z-arrays."""
+        return {
+            "rows": rows,
+            "ids": self._mlbam_ids[rows],
+            "arrays": self.distance_calc.prepare_arrays(self._z_matrix[rows]),
+        }
+
+    def _gather_records(self, rows: np.ndarray) -> List[Dict[str, Any]]:
+        """Build one plain dict per dataset position from the record arrays."""
+        columns = {c: arr[rows].tolist() for c, arr in self._record_arrays.items()}
+        return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+    def _gather_values(self, rows: np.ndarray) -> List[Dict[str, float]]:
+        """Non-NaN metric and arm angle values for each dataset position."""
+        cols = self._value_columns
+        return [
+            {c: v for c, v, ok in zip(cols, values, present) if ok}
+            for values, present in zip(
+                self._values[rows].tolist(), self._values_present[rows].tolist()
+            )
+        ]
+
+    def _player_season_rows(self, player_id: int, season: int) -> np.ndarray:
+        """Dataset positions for a pitcher-season (empty if not present)."""
+        return self._by_player_season.get(
+            (player_id, season), np.empty(0, dtype=np.intp)
+        )
+
     def get_pitcher_pitches(
         self, player_id: int, season: int
     ) -> List[Dict[str, Any]]:
@@ -84,29 +196,28 @@ class PitchSimilarityEngine:
         Returns:
             List of dicts, one per pitch type, with all metrics.
         """
-        mask = (
-            (self.dataset["mlbam_id"] == player_id)
-            & (self.dataset["season"] == season)
-        )
-        rows = self.dataset[mask]
+        # Copy the cached dicts so callers can't mutate the memoized result
+        return [dict(p) for p in self._cached_pitches(player_id, season)]
 
-        if rows.empty:
+    def _get_pitcher_pitches(
+        self, player_id: int, season: int
+    ) -> List[Dict[str, Any]]:
+        """Uncached get_pitcher_pitches."""
+        rows = self._player_season_rows(player_id, season)
+        if len(rows) == 0:
             return []
 
+        records = self._gather_records(rows)
+        values = self._gather_values(rows)
+
         pitches = []
-        for _, row in rows.iterrows():
+        for row, row_values in zip(records, values):
             pitch = {
                 "pitch_type": row["pitch_type"],
                 "pitch_name": row.get("pitch_name", row["pitch_type"]),
                 "n_pitches": int(row.get("n_pitches", 0)),
             }
-            for metric in self.metrics:
-                if metric in row and pd.notna(row[metric]):
-                    pitch[metric] = row[metric]
-
-            if "arm_angle" in row and pd.notna(row["arm_angle"]):
-                pitch["arm_angle"] = row["arm_angle"]
-
+            pitch.update(row_values)
             pitches.append(pitch)
 
         # Sort by n_pitches descending
@@ -130,71 +241,66 @@ class PitchSimilarityEngine:
             - mlbam_id, first_name, last_name, season, similarity, distance
             - All pitch metrics for the matching pitch
         """
-        target_mask = (
-            (self.dataset["mlbam_id"] == player_id)
-            & (self.dataset["season"] == season)
-        )
-        target_rows = self.dataset[target_mask]
+        return {
+            pitch_type: [dict(m) for m in matches]
+            for pitch_type, matches in self._cached_similar(
+                player_id, season, top_n
+            ).items()
+        }
 
-        if target_rows.empty:
+    def _find_similar_pitches(
+        self, player_id: int, season: int, top_n: int
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Uncached find_similar_pitches."""
+        target_rows = self._player_season_rows(player_id, season)
+
+        if len(target_rows) == 0:
             return {}
 
         results = {}
-        for _, target in target_rows.iterrows():
+        for target_idx in target_rows:
+            target = self.dataset.iloc[target_idx]
             pitch_type = target["pitch_type"]
 
-            # Get all candidates with the same pitch type, excluding same pitcher
-            # Only allow comps with enough pitches and Stuff+ data
-            candidates = self.dataset[
-                (self.dataset["pitch_type"] == pitch_type)
-                & (self.dataset["mlbam_id"] != player_id)
-                & (self.dataset["n_pitches"] >= MIN_COMP_PITCHES)
-                & (self.dataset["stuff_plus"].notna())
-            ]
-
             # Filter by role: starters comp to starters, relievers to relievers
             # Uses is_starter flag based on GS/G ratio (not IP)
-            if "is_starter" in self.dataset.columns:
-                target_starter = target.get("is_starter")
-                if pd.notna(target_starter):
-                    candidates = candidates[
-                        candidates["is_starter"] == target_starter
-                    ]
-
-            if candidates.empty:
+            role = None
+            if self._roles is not None and pd.notna(self._roles[target_idx]):
+                role = bool(self._roles[target_idx])
+
+            # Candidates with the same pitch type, role, enough pitches and
+            # Stuff+ data are pre-bucketed; only the same pitcher is excluded here
+            bucket = self._buckets.get((pitch_type, role))
+            if bucket is None or len(bucket["rows"]) == 0:
                 continue
 
-            # Calculate distances using z-scored metrics
-            available_z = [z for z in self._z_columns if z in candidates.columns]
-            if not available_z:
-                continue
-
-            distances = self.distance_calc.calculate_all_distances(
-                target, candidates, available_z
+            positions, distances, similarities = (
+                self.distance_calc.top_k_similar(
+                    self._z_matrix[target_idx],
+                    bucket["arrays"],
+                    self._z_columns,
+                    top_n,
+                    self.max_distance,
+                    mask=bucket["ids"] != player_id,
+                )
             )
 
-            candidates = candidates.copy()
-            candidates["distance"] = distances
-            candidates = candidates[candidates["distance"] < float("inf")]
-
-            if candidates.empty:
+            if len(positions) == 0:
                 continue
 
-            candidates["similarity"] = candidates["distance"].apply(
-                lambda d: self.distance_calc.distance_to_similarity(
-                    d, self.max_distance
-                )
-            )
-
-            top_matches = candidates.nsmallest(top_n, "distance")
+            match_rows = bucket["rows"][positions]
+            records = self._gather_records(match_rows)
+            values = self._gather_values(match_rows)
 
             matches = []
-            for _, match in top_matches.iterrows():
+            for match, match_values, similarity, distance in zip(
+                records, values, similarities, distances
+            ):
                 match_dict = {
                     "mlbam_id": int(match["mlbam_id"]),
                     "season": int(match["season"]),
-                    "similarity": round(match["similarity"], 1),
-                    "distance": round(match["distance"], 4),
+                    "similarity": round(similarity, 1),
+                    "distance": round(distance, 4),
                     "pitch_type": pitch_type,
                     "pitch_name": match.get("pitch_name", pitch_type),
                     "n_pitches": int(match.get("n_pitches", 0)),
@@ -205,13 +311,7 @@ class PitchSimilarityEngine:
                         f"{match['first_name']} {match['last_name']}"
                     )
 
-                for metric in self.metrics:
-                    if metric in match and pd.notna(match[metric]):
-                        match_dict[metric] = match[metric]
-
-                if "arm_angle" in match and pd.notna(match["arm_angle"]):
-                    match_dict["arm_angle"] = match["arm_angle"]
-
+                match_dict.update(match_values)
                 matches.append(match_dict)
 
             results[pitch_type] = matches
@@ -222,14 +322,19 @@ class PitchSimilarityEngine:
         self, player_id: int, season: int
     ) -> Optional[Dict[str, Any]]:
         """Get pitcher name and arm angle from the dataset."""
-        mask = (
-            (self.dataset["mlbam_id"] == player_id)
-            & (self.dataset["season"] == season)
-        )
-        rows = self.dataset[mask]
-        if rows.empty:
+        info = self._cached_info(player_id, season)
+        return dict(info) if info is not None else None
+
+    def _get_pitcher_info(
+        self, player_id: int, season: int
+    ) -> Optional[Dict[str, Any]]:
+        """Uncached get_pitcher_info."""
+        positions = self._player_season_rows(player_id, season)
+        if len(positions) == 0:
             return None
 
+        rows = self.dataset.iloc[positions]
+
         first_row = rows.iloc[0]
         info = {
             "mlbam_id": player_id,
@@ -1,32 +1,71 @@
 """Side-by-side player cards with Squarespace-inspired light theme."""
 
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Callable, Dict, Any, List, Tuple
 import streamlit as st
-import streamlit.components.v1 as components
+
+from .styles import FONT_LINK, FRAME_HEIGHT_SCRIPT
+
+
+# Percentile colors by decile (red = good, blue = bad); 40-59 share the gray
+_PCT_COLORS = (
+    "#2563eb",
+    "#3b82f6",
+    "#60a5fa",
+    "#93c5fd",
+    "#9ca3af",
+    "#9ca3af",
+    "#fca5a5",
+    "#f87171",
+    "#ef4444",
+    "#dc2626",
+)
+
+
+def get_percentile_bucket(percentile: float) -> int:
+    """Decile index (0-9) into _PCT_COLORS for a percentile."""
+    return min(max(int(percentile), 0) // 10, 9)
 
 
 def get_percentile_color(percentile: float) -> str:
     """Get color based on percentile (red = good, blue = bad)."""
-    if percentile >= 90:
-        return "#dc2626"
-    elif percentile >= 80:
-        return "#ef4444"
-    elif percentile >= 70:
-        return "#f87171"
-    elif percentile >= 60:
-        return "#fca5a5"
-    elif percentile >= 40:
-        return "#9ca3af"
-    elif percentile >= 30:
-        return "#93c5fd"
-    elif percentile >= 20:
-        return "#60a5fa"
-    elif percentile >= 10:
-        return "#3b82f6"
-    else:
-        return "#2563eb"
+    return _PCT_COLORS[get_percentile_bucket(percentile)]
+
+
+# One class per decile so rows only carry "pct-N"; bars and badges read var(--c)
+_PCT_CSS = "\n".join(
+    f"            .pct-{i} {{ --c: {color}; }}" for i, color in enumerate(_PCT_COLORS)
+)
+
+
+def _is_missing(value: Any) -> bool:
+    """True for None and NaN (the only value not equal to itself)."""
+    return value is None or value != value
+
+
+def _metric_cell(
+    player: Dict[str, Any],
+    percentiles: Dict[str, Any],
+    metric_name: str,
+    fmt: Callable[[Any], str],
+) -> Tuple[str, Any, int]:
+    """Formatted value, percentile and badge number for one metric.
+
+    Missing values show "—" at the 50th percentile.
+    """
+    value = player.get(metric_name)
+    if _is_missing(value):
+        return "—", 50, 50
+    pct = percentiles.get(f"{metric_name}_pct", 50)
+    return fmt(value), pct, pct if type(pct) is int else int(pct)
+
 
+def _result_cell(value: Any, fmt: str) -> str:
+    """Formatted results stat ("—" if missing)."""
+    return "—" if _is_missing(value) else fmt.format(float(value))
 
+
+@lru_cache(maxsize=1024)
 def get_player_photo_url(mlbam_id: int) -> str:
     """Get Baseball Savant/MLB headshot URL for a player."""
     return f"https://img.mlbstatic.com/mlb-photos/image/upload/d_people:generic:headshot:67:current.png/w_213,q_auto:best/v1/people/{mlbam_id}/headshot/67/current"
@@ -34,45 +73,45 @@ def get_player_photo_url(mlbam_id: int) -> str:
 
 # Batter metrics configuration
 BATTER_METRICS_CONFIG = [
-    ("exit_velocity", "Exit Velo", "{:.1f}", " mph"),
-    ("max_exit_velocity", "Max EV", "{:.1f}", " mph"),
-    ("barrel_pct", "Barrel %", "{:.1f}", "%"),
-    ("hard_hit_pct", "Hard Hit %", "{:.1f}", "%"),
-    ("pulled_fb_pct", "Pull Air %", "{:.1f}", "%"),
-    ("xwoba", "xwOBA", "{:.3f}", ""),
-    ("k_pct", "K %", "{:.1f}", "%"),
-    ("bb_pct", "BB %", "{:.1f}", "%"),
-    ("chase_rate", "Chase %", "{:.1f}", "%"),
-    ("zone_contact_pct", "Z-Con %", "{:.1f}", "%"),
-    ("whiff_pct", "Whiff %", "{:.1f}", "%"),
-    ("swstr_pct", "SwStr %", "{:.1f}", "%"),
-    ("gb_pct", "GB %", "{:.1f}", "%"),
+    ("exit_velocity", "Exit Velo", "{:.1f} mph".format),
+    ("max_exit_velocity", "Max EV", "{:.1f} mph".format),
+    ("barrel_pct", "Barrel %", "{:.1f}%".format),
+    ("hard_hit_pct", "Hard Hit %", "{:.1f}%".format),
+    ("pulled_fb_pct", "Pull Air %", "{:.1f}%".format),
+    ("xwoba", "xwOBA", "{:.3f}".format),
+    ("k_pct", "K %", "{:.1f}%".format),
+    ("bb_pct", "BB %", "{:.1f}%".format),
+    ("chase_rate", "Chase %", "{:.1f}%".format),
+    ("zone_contact_pct", "Z-Con %", "{:.1f}%".format),
+    ("whiff_pct", "Whiff %", "{:.1f}%".format),
+    ("swstr_pct", "SwStr %", "{:.1f}%".format),
+    ("gb_pct", "GB %", "{:.1f}%".format),
 ]
 
 # Pitcher metrics configuration
 # Grouped: KPIs -> Ks -> Command -> Damage Control -> Luck
 PITCHER_METRICS_CONFIG = [
     # KPIs
-    ("xera", "xERA", "{:.2f}", ""),
-    ("xfip", "xFIP", "{:.2f}", ""),
-    ("k_bb_pct", "K-BB %", "{:.1f}", "%"),
+    ("xera", "xERA", "{:.2f}".format),
+    ("xfip", "xFIP", "{:.2f}".format),
+    ("k_bb_pct", "K-BB %", "{:.1f}%".format),
     # Ks
-    ("k_pct", "K %", "{:.1f}", "%"),
-    ("whiff_pct", "Whiff %", "{:.1f}", "%"),
-    ("chase_pct", "Chase %", "{:.1f}", "%"),
-    ("zone_contact_pct", "Z-Con %", "{:.1f}", "%"),
-    ("stuff_plus", "Stuff+", "{:.0f}", ""),
+    ("k_pct", "K %", "{:.1f}%".format),
+    ("whiff_pct", "Whiff %", "{:.1f}%".format),
+    ("chase_pct", "Chase %", "{:.1f}%".format),
+    ("zone_contact_pct", "Z-Con %", "{:.1f}%".format),
+    ("stuff_plus", "Stuff+", "{:.0f}".format),
     # Command
-    ("bb_pct", "BB %", "{:.1f}", "%"),
-    ("zone_pct", "Zone %", "{:.1f}", "%"),
-    ("arm_angle", "Arm Angle", "{:.1f}", "°"),
+    ("bb_pct", "BB %", "{:.1f}%".format),
+    ("zone_pct", "Zone %", "{:.1f}%".format),
+    ("arm_angle", "Arm Angle", "{:.1f}°".format),
     # Damage Control
-    ("hard_hit_pct_against", "Hard Hit %", "{:.1f}", "%"),
-    ("barrel_pct_against", "Barrel %", "{:.1f}", "%"),
-    ("gb_pct", "GB %", "{:.1f}", "%"),
+    ("hard_hit_pct_against", "Hard Hit %", "{:.1f}%".format),
+    ("barrel_pct_against", "Barrel %", "{:.1f}%".format),
+    ("gb_pct", "GB %", "{:.1f}%".format),
     # Luck
-    ("babip", "BABIP", "{:.3f}", ""),
-    ("lob_pct", "LOB %", "{:.1f}", "%"),
+    ("babip", "BABIP", "{:.3f}".format),
+    ("lob_pct", "LOB %", "{:.1f}%".format),
 ]
 
 # Batter results stats
@@ -101,7 +140,60 @@ PITCHER_RESULTS_STATS = [
     ("WAR", "WAR", "{:.1f}"),
 ]
 
+# Config lookups by player type; anything other than "Pitcher" renders as a hitter
+_METRICS_BY_TYPE = {
+    "Hitter": BATTER_METRICS_CONFIG,
+    "Pitcher": PITCHER_METRICS_CONFIG,
+}
+_RESULTS_BY_TYPE = {
+    "Hitter": BATTER_RESULTS_STATS,
+    "Pitcher": PITCHER_RESULTS_STATS,
+}
+
+# Initial comparison iframe heights (cards plus season results); pitchers have
+# more metrics and more results stats that wrap. The page script resizes to fit.
+_FRAME_HEIGHTS = {"Hitter": 1200, "Pitcher": 1500}
+
+
+# Per-row markup templates, filled with str.format and joined once per section
+_STAT_ROW_TMPL = """
+        <div class="stat-row pct-{bucket}">
+            <span class="stat-name">{name}</span>
+            <span class="stat-value">{val}</span>
+            <div class="stat-bar">
+                <div class="stat-bar-fill" style="width: {pct}%;"></div>
+            </div>
+            <span class="stat-pct">{pct_int}</span>
+        </div>
+        """
 
+_RESULT_STAT_TMPL = """
+        <div class="result-stat">
+            <div class="result-label">{label}</div>
+            <div class="result-value">{val}</div>
+        </div>
+        """
+
+_MOBILE_ROW_TMPL = """
+        <tr class="m-row">
+            <td class="m-val">{t_val}</td>
+            <td class="m-pct"><span class="m-pct-badge pct-{t_bucket}">{t_pct}</span></td>
+            <td class="m-stat">{name}</td>
+            <td class="m-pct"><span class="m-pct-badge pct-{c_bucket}">{c_pct}</span></td>
+            <td class="m-val">{c_val}</td>
+        </tr>
+        """
+
+_MOBILE_RESULT_ROW_TMPL = """
+        <tr class="m-row">
+            <td class="m-val" colspan="2">{t_val}</td>
+            <td class="m-stat">{label}</td>
+            <td class="m-val" colspan="2">{c_val}</td>
+        </tr>
+        """
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
 def render_player_card(
     player: Dict[str, Any],
     card_id: str = "",
@@ -109,10 +201,11 @@ def render_player_card(
     player_type: str = "Hitter",
 ) -> str:
     """Generate HTML for a player card."""
-    name = player.get("name", "Unknown")
-    season = player.get("season", "")
-    mlbam_id = player.get("mlbam_id", 0)
-    percentiles = player.get("percentiles", {})
+    pget = player.get
+    name = pget("name", "Unknown")
+    season = pget("season", "")
+    mlbam_id = pget("mlbam_id", 0)
+    percentiles = pget("percentiles", {})
     photo_url = get_player_photo_url(mlbam_id)
 
     # Different styling - target player gets blue header, comp gets light
@@ -124,34 +217,21 @@ def render_player_card(
     label_color = "#999" if is_comp else "#a0c4e8"
 
     # Select metrics based on player type
-    if player_type == "Pitcher":
-        metrics_config = PITCHER_METRICS_CONFIG
-    else:
-        metrics_config = BATTER_METRICS_CONFIG
-
-    rows_html = ""
-    for metric_name, display_name, fmt, suffix in metrics_config:
-        value = player.get(metric_name)
-        pct = percentiles.get(f"{metric_name}_pct", 50)
-
-        if value is None or str(value) == "nan":
-            val_str = "—"
-            pct = 50
-        else:
-            val_str = f"{fmt.format(value)}{suffix}"
-
-        color = get_percentile_color(pct)
-
-        rows_html += f"""
-        <div class="stat-row">
-            <span class="stat-name">{display_name}</span>
-            <span class="stat-value">{val_str}</span>
-            <div class="stat-bar">
-                <div class="stat-bar-fill" style="width: {pct}%; background: {color};"></div>
-            </div>
-            <span class="stat-pct" style="background:{color};">{int(pct)}</span>
-        </div>
-        """
+    metrics_config = _METRICS_BY_TYPE.get(player_type, BATTER_METRICS_CONFIG)
+
+    rows = []
+    for metric_name, display_name, fmt in metrics_config:
+        val_str, pct, pct_int = _metric_cell(player, percentiles, metric_name, fmt)
+        rows.append(
+            _STAT_ROW_TMPL.format(
+                name=display_name,
+                val=val_str,
+                pct=pct,
+                bucket=get_percentile_bucket(pct_int),
+                pct_int=pct_int,
+            )
+        )
+    rows_html = "".join(rows)
 
     return f"""
     <div class="player-card" id="{card_id}">
@@ -172,28 +252,30 @@ def render_player_card(
 
 def render_results_section(player: Dict[str, Any], player_type: str = "Hitter") -> str:
     """Generate HTML for player results stats."""
-    name = player.get("name", "Unknown")
-    season = player.get("season", "")
-
     # Select stats based on player type
-    if player_type == "Pitcher":
-        stats = PITCHER_RESULTS_STATS
-    else:
-        stats = BATTER_RESULTS_STATS
-
-    stats_html = ""
-    for key, label, fmt in stats:
-        value = player.get(key)
-        if value is None or str(value) == "nan":
-            val_str = "—"
-        else:
-            val_str = fmt.format(float(value))
-        stats_html += f"""
-        <div class="result-stat">
-            <div class="result-label">{label}</div>
-            <div class="result-value">{val_str}</div>
-        </div>
-        """
+    stats = _RESULTS_BY_TYPE.get(player_type, BATTER_RESULTS_STATS)
+
+    # Cache on just the fields shown, so the same player-season is formatted once
+    pget = player.get
+    return _render_results_cached(
+        pget("name", "Unknown"),
+        pget("season", ""),
+        player_type,
+        tuple(pget(key) for key, _, _ in stats),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _render_results_cached(
+    name: str, season: Any, player_type: str, values: Tuple[Any, ...]
+) -> str:
+    """render_results_section body, keyed on hashable arguments."""
+    stats = _RESULTS_BY_TYPE.get(player_type, BATTER_RESULTS_STATS)
+
+    stats_html = "".join(
+        _RESULT_STAT_TMPL.format(label=label, val=_result_cell(value, fmt))
+        for (_, label, fmt), value in zip(stats, values)
+    )
 
     return f"""
     <div class="results-card">
@@ -203,74 +285,70 @@ def render_results_section(player: Dict[str, Any], player_type: str = "Hitter")
     """
 
 
+def _mobile_metric_row(
+    target: Dict[str, Any],
+    comp: Dict[str, Any],
+    t_pcts: Dict[str, Any],
+    c_pcts: Dict[str, Any],
+    metric_name: str,
+    display_name: str,
+    fmt: Callable[[Any], str],
+) -> str:
+    """One mobile table row: target value/badge, stat name, comp badge/value."""
+    t_str, _, t_int = _metric_cell(target, t_pcts, metric_name, fmt)
+    c_str, _, c_int = _metric_cell(comp, c_pcts, metric_name, fmt)
+    return _MOBILE_ROW_TMPL.format(
+        t_val=t_str,
+        t_bucket=get_percentile_bucket(t_int),
+        t_pct=t_int,
+        name=display_name,
+        c_bucket=get_percentile_bucket(c_int),
+        c_pct=c_int,
+        c_val=c_str,
+    )
+
+
+@lru_cache(maxsize=2048)
+def _player_display(mlbam_id: int, name: str, season: Any) -> Tuple[str, Any, str, str]:
+    """Header strings for a player: (name, season, photo URL, last name)."""
+    return name, season, get_player_photo_url(mlbam_id), name.split()[-1]
+
+
 def _build_mobile_comparison(
     target: Dict[str, Any],
     comp: Dict[str, Any],
     player_type: str,
 ) -> str:
     """Build a unified mobile comparison table — both players on every row."""
-    metrics = PITCHER_METRICS_CONFIG if player_type == "Pitcher" else BATTER_METRICS_CONFIG
-    t_pcts = target.get("percentiles", {})
-    c_pcts = comp.get("percentiles", {})
-
-    rows = ""
-    for metric_name, display_name, fmt, suffix in metrics:
-        t_val = target.get(metric_name)
-        c_val = comp.get(metric_name)
-        t_pct = t_pcts.get(f"{metric_name}_pct", 50)
-        c_pct = c_pcts.get(f"{metric_name}_pct", 50)
-
-        if t_val is None or str(t_val) == "nan":
-            t_str = "—"
-            t_pct = 50
-        else:
-            t_str = f"{fmt.format(t_val)}{suffix}"
-        if c_val is None or str(c_val) == "nan":
-            c_str = "—"
-            c_pct = 50
-        else:
-            c_str = f"{fmt.format(c_val)}{suffix}"
-
-        t_color = get_percentile_color(t_pct)
-        c_color = get_percentile_color(c_pct)
-
-        rows += f"""
-        <tr class="m-row">
-            <td class="m-val">{t_str}</td>
-            <td class="m-pct"><span class="m-pct-badge" style="background:{t_color};">{int(t_pct)}</span></td>
-            <td class="m-stat">{display_name}</td>
-            <td class="m-pct"><span class="m-pct-badge" style="background:{c_color};">{int(c_pct)}</span></td>
-            <td class="m-val">{c_str}</td>
-        </tr>
-        """
+    metrics = _METRICS_BY_TYPE.get(player_type, BATTER_METRICS_CONFIG)
+    tget, cget = target.get, comp.get
+    t_pcts = tget("percentiles", {})
+    c_pcts = cget("percentiles", {})
+
+    rows = "".join(
+        _mobile_metric_row(target, comp, t_pcts, c_pcts, metric_name, display_name, fmt)
+        for metric_name, display_name, fmt in metrics
+    )
 
     # Results row
-    if player_type == "Pitcher":
-        results_stats = PITCHER_RESULTS_STATS
-    else:
-        results_stats = BATTER_RESULTS_STATS
-
-    results_rows = ""
-    for key, label, fmt_r in results_stats:
-        t_v = target.get(key)
-        c_v = comp.get(key)
-        t_s = "—" if t_v is None or str(t_v) == "nan" else fmt_r.format(float(t_v))
-        c_s = "—" if c_v is None or str(c_v) == "nan" else fmt_r.format(float(c_v))
-        results_rows += f"""
-        <tr class="m-row">
-            <td class="m-val" colspan="2">{t_s}</td>
-            <td class="m-stat">{label}</td>
-            <td class="m-val" colspan="2">{c_s}</td>
-        </tr>
-        """
+    results_stats = _RESULTS_BY_TYPE.get(player_type, BATTER_RESULTS_STATS)
+
+    results_rows = "".join(
+        _MOBILE_RESULT_ROW_TMPL.format(
+            t_val=_result_cell(tget(key), fmt_r),
+            label=label,
+            c_val=_result_cell(cget(key), fmt_r),
+        )
+        for key, label, fmt_r in results_stats
+    )
 
-    t_name = target.get("name", "Unknown")
-    t_season = target.get("season", "")
-    t_photo = get_player_photo_url(target.get("mlbam_id", 0))
-    c_name = comp.get("name", "Unknown")
-    c_season = comp.get("season", "")
-    c_photo = get_player_photo_url(comp.get("mlbam_id", 0))
-    score = comp.get("similarity", 0)
+    t_name, t_season, t_photo, t_last = _player_display(
+        tget("mlbam_id", 0), tget("name", "Unknown"), tget("season", "")
+    )
+    c_name, c_season, c_photo, c_last = _player_display(
+        cget("mlbam_id", 0), cget("name", "Unknown"), cget("season", "")
+    )
+    score = cget("similarity", 0)
 
     return f"""
     <div class="m-card">
@@ -291,9 +369,9 @@ def _build_mobile_comparison(
         <table class="m-table">
             <thead>
                 <tr class="m-thead-row">
-                    <th class="m-th-val" colspan="2">{t_name.split()[-1]}</th>
+                    <th class="m-th-val" colspan="2">{t_last}</th>
                     <th class="m-th-stat"></th>
-                    <th class="m-th-val" colspan="2">{c_name.split()[-1]}</th>
+                    <th class="m-th-val" colspan="2">{c_last}</th>
                 </tr>
             </thead>
             <tbody>{rows}</tbody>
@@ -307,113 +385,66 @@ def _build_mobile_comparison(
     """
 
 
-def render_comparison(
-    target_player: Dict[str, Any],
-    similar_players: List[Dict[str, Any]],
-    player_type: str = "Hitter",
-) -> None:
-    """Render full comparison view."""
-    if not similar_players:
-        st.warning("No similar players found.")
-        return
-
-    # Store similar players in session state for clickable cards
-    if "similar_players" not in st.session_state:
-        st.session_state.similar_players = similar_players
-    else:
-        st.session_state.similar_players = similar_players
-
-    if "selected_comp_index" not in st.session_state:
-        st.session_state.selected_comp_index = 0
-
-    top = similar_players[st.session_state.selected_comp_index]
-    score = top.get("similarity", 0)
-
-    # Large similarity score display
-    st.markdown(
-        f"""
-    <style>
-        .sim-score-wrapper {{ text-align: center; padding: 0.5rem 0 1rem; }}
-        .sim-score-label {{ font-size: 0.65rem; font-weight: 600; text-transform: uppercase; letter-spacing: 0.2em; color: #999; margin-bottom: 0.25rem; }}
-        .sim-score-value {{ font-family: 'DM Serif Display', serif; font-size: 5rem; font-weight: 400; color: #000; line-height: 1; letter-spacing: -0.02em; }}
-        @media (max-width: 768px) {{
-            .sim-score-wrapper {{ display: none; }}
-        }}
-    </style>
-    <div class="sim-score-wrapper">
-        <div class="sim-score-label">Similarity Score</div>
-        <div class="sim-score-value">{score:.1f}%</div>
-    </div>
-    """,
-        unsafe_allow_html=True,
-    )
-
-    # Cards HTML
-    left = render_player_card(
-        target_player, "target-card", is_comp=False, player_type=player_type
-    )
-    right = render_player_card(
-        top, "comp-card", is_comp=True, player_type=player_type
-    )
-
-    # Mobile: unified comparison table
-    mobile_html = _build_mobile_comparison(target_player, top, player_type)
-
-    html = f"""
+# Static CSS/markup for the comparison view, kept as plain strings so only
+# the player-specific parts are formatted per render
+_COMPARISON_HEAD = (
+    """
     <!DOCTYPE html>
     <html>
     <head>
-        <link href="https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;600;700&family=DM+Serif+Display&display=swap" rel="stylesheet">
+        """
+    + FONT_LINK
+    + """
         <style>
-            * {{ margin:0; padding:0; box-sizing:border-box; }}
-            body {{
+            * { margin:0; padding:0; box-sizing:border-box; }
+            body {
                 font-family: 'DM Sans', -apple-system, BlinkMacSystemFont, sans-serif;
                 background: transparent;
-            }}
+            }
 
             /* ── Desktop layout ── */
-            .desktop-layout {{
+            .desktop-layout {
                 display: flex;
                 gap: 1.5rem;
                 padding: 0.5rem 0;
-            }}
-            .card-column {{
+            }
+            .card-column {
                 flex: 1;
                 display: flex;
                 flex-direction: column;
-            }}
-            .follow-banner {{
+            }
+            .follow-banner {
                 text-align: center;
                 font-size: 0.75rem;
                 font-weight: 600;
                 color: #666;
                 margin-bottom: 0.5rem;
                 letter-spacing: 0.02em;
-            }}
-            .follow-banner a {{
+            }
+            .follow-banner a {
                 color: #1e2a5a;
                 text-decoration: none;
-            }}
-            .follow-banner a:hover {{
+            }
+            .follow-banner a:hover {
                 text-decoration: underline;
-            }}
-            .player-card {{
+            }
+            .player-card {
                 flex: 1;
                 background: #fff;
                 border: 1px solid #e5e5e5;
                 border-radius: 16px;
                 overflow: hidden;
                 box-shadow: 0 2px 8px rgba(0,0,0,0.04);
-            }}
-            .card-top {{
+            }
+            .card-top {
                 background: #fafafa;
                 padding: 1.25rem 1.5rem;
                 border-bottom: 1px solid #e5e5e5;
                 display: flex;
                 align-items: center;
                 gap: 1rem;
-            }}
-            .player-photo-wrapper {{
+            }
+            .player-photo-wrapper {
                 width: 60px;
                 height: 60px;
                 border-radius: 50%;
@@ -421,76 +452,77 @@ def render_comparison(
                 background: #f0f0f0;
                 flex-shrink: 0;
                 border: 2px solid #e5e5e5;
-            }}
-            .player-photo {{
+            }
+            .player-photo {
                 width: 100%;
                 height: 100%;
                 object-fit: cover;
-            }}
-            .player-info {{
+            }
+            .player-info {
                 flex: 1;
-            }}
-            .player-name {{
+            }
+            .player-name {
                 font-family: 'DM Serif Display', serif;
                 font-size: 1.4rem;
                 font-weight: 400;
                 color: #000;
                 letter-spacing: -0.02em;
-            }}
-            .card-label {{
+            }
+            .card-label {
                 font-size: 0.65rem;
                 font-weight: 600;
                 text-transform: uppercase;
                 letter-spacing: 0.1em;
                 margin-bottom: 0.2rem;
-            }}
-            .player-season {{
+            }
+            .player-season {
                 font-size: 0.85rem;
                 color: #666;
                 margin-top: 0.1rem;
                 font-weight: 500;
-            }}
-            .card-stats {{
+            }
+            .card-stats {
                 padding: 0.5rem 1.25rem 1rem;
-            }}
-            .stat-row {{
+            }
+            .stat-row {
                 display: flex;
                 align-items: center;
                 padding: 0.5rem 0;
                 border-bottom: 1px solid #f0f0f0;
-            }}
-            .stat-row:last-child {{
+            }
+            .stat-row:last-child {
                 border-bottom: none;
-            }}
-            .stat-name {{
+            }
+            .stat-name {
                 width: 80px;
                 font-size: 0.8rem;
                 color: #666;
                 font-weight: 500;
                 flex-shrink: 0;
-            }}
-            .stat-value {{
+            }
+            .stat-value {
                 width: 70px;
                 font-size: 0.85rem;
                 font-weight: 600;
                 color: #000;
                 text-align: right;
                 flex-shrink: 0;
-            }}
-            .stat-bar {{
+            }
+            .stat-bar {
                 flex: 1;
                 height: 8px;
                 margin: 0 12px;
                 background: #e5e5e5;
                 border-radius: 4px;
                 overflow: hidden;
-            }}
-            .stat-bar-fill {{
+            }
+            .stat-bar-fill {
                 height: 100%;
                 border-radius: 4px;
+                background: var(--c);
                 transition: width 0.3s ease;
-            }}
-            .stat-pct {{
+            }
+            .stat-pct {
                 min-width: 36px;
                 height: 24px;
                 border-radius: 5px;
@@ -500,28 +532,32 @@ def render_comparison(
                 font-size: 0.7rem;
                 font-weight: 700;
                 color: #fff;
+                background: var(--c);
                 flex-shrink: 0;
-            }}
+            }
+"""
+    + _PCT_CSS
+    + """
 
             /* ── Mobile layout ── */
-            .mobile-layout {{ display: none; }}
+            .mobile-layout { display: none; }
 
-            .m-card {{
+            .m-card {
                 background: #fff;
                 border: 1px solid #e0e0e0;
                 border-radius: 14px;
                 overflow: hidden;
                 box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-            }}
-            .m-score {{
+            }
+            .m-score {
                 text-align: center;
                 font-family: 'DM Serif Display', serif;
                 font-size: 2.2rem;
                 color: #1e3a5f;
                 padding: 0.75rem 0 0;
                 line-height: 1;
-            }}
-            .m-score-label {{
+            }
+            .m-score-label {
                 display: block;
                 font-family: 'DM Sans', sans-serif;
                 font-size: 0.55rem;
@@ -530,18 +566,18 @@ def render_comparison(
                 letter-spacing: 0.15em;
                 color: #999;
                 margin-top: 0.15rem;
-            }}
-            .m-header {{
+            }
+            .m-header {
                 display: flex;
                 align-items: center;
                 padding: 0.6rem 1rem 0.75rem;
                 gap: 0.5rem;
-            }}
-            .m-player {{
+            }
+            .m-player {
                 flex: 1;
                 text-align: center;
-            }}
-            .m-photo {{
+            }
+            .m-photo {
                 width: 48px;
                 height: 48px;
                 border-radius: 50%;
@@ -550,34 +586,34 @@ def render_comparison(
                 display: block;
                 background: #f0f0f0;
                 border: 2px solid #e5e5e5;
-            }}
-            .m-photo-target {{
+            }
+            .m-photo-target {
                 border-color: #1e3a5f;
-            }}
-            .m-name {{
+            }
+            .m-name {
                 font-family: 'DM Serif Display', serif;
                 font-size: 0.9rem;
                 color: #000;
                 line-height: 1.15;
-            }}
-            .m-season {{
+            }
+            .m-season {
                 font-size: 0.7rem;
                 color: #888;
                 font-weight: 500;
-            }}
-            .m-vs {{
+            }
+            .m-vs {
                 font-size: 0.7rem;
                 font-weight: 700;
                 color: #ccc;
                 text-transform: uppercase;
                 flex-shrink: 0;
                 padding-top: 1rem;
-            }}
-            .m-table {{
+            }
+            .m-table {
                 width: 100%;
                 border-collapse: collapse;
-            }}
-            .m-thead-row th {{
+            }
+            .m-thead-row th {
                 padding: 0.35rem 0.4rem 0.25rem;
                 font-size: 0.6rem;
                 font-weight: 600;
@@ -585,39 +621,39 @@ def render_comparison(
                 letter-spacing: 0.06em;
                 color: #aaa;
                 border-bottom: 2px solid #f0f0f0;
-            }}
-            .m-th-stat {{
+            }
+            .m-th-stat {
                 text-align: center;
-            }}
-            .m-th-val {{
+            }
+            .m-th-val {
                 text-align: center;
-            }}
-            .m-row td {{
+            }
+            .m-row td {
                 padding: 0.35rem 0.3rem;
                 border-bottom: 1px solid #f5f5f5;
-            }}
-            .m-row:last-child td {{
+            }
+            .m-row:last-child td {
                 border-bottom: none;
-            }}
-            .m-stat {{
+            }
+            .m-stat {
                 text-align: center;
                 font-size: 0.68rem;
                 font-weight: 600;
                 color: #888;
                 white-space: nowrap;
-            }}
-            .m-val {{
+            }
+            .m-val {
                 text-align: center;
                 font-size: 0.78rem;
                 font-weight: 600;
                 color: #111;
                 font-variant-numeric: tabular-nums;
-            }}
-            .m-pct {{
+            }
+            .m-pct {
                 text-align: center;
                 padding: 0.35rem 0.15rem;
-            }}
-            .m-pct-badge {{
+            }
+            .m-pct-badge {
                 display: inline-block;
                 min-width: 22px;
                 padding: 1px 4px;
@@ -625,9 +661,10 @@ def render_comparison(
                 font-size: 0.55rem;
                 font-weight: 700;
                 color: #fff;
+                background: var(--c);
                 text-align: center;
-            }}
-            .m-results-divider {{
+            }
+            .m-results-divider {
                 text-align: center;
                 font-size: 0.6rem;
                 font-weight: 600;
@@ -637,8 +674,8 @@ def render_comparison(
                 padding: 0.6rem 0 0.3rem;
                 border-top: 2px solid #f0f0f0;
                 margin-top: 0.25rem;
-            }}
-            .m-follow {{
+            }
+            .m-follow {
                 text-align: center;
                 font-size: 0.6rem;
                 font-weight: 600;
@@ -646,173 +683,245 @@ def render_comparison(
                 padding: 0.75rem 0;
                 border-top: 1px solid #f0f0f0;
                 margin-top: 0.25rem;
-            }}
-            .m-follow a {{
+            }
+            .m-follow a {
                 color: #1e3a5f;
                 text-decoration: none;
-            }}
+            }
 
-            @media (max-width: 768px) {{
-                .desktop-layout {{ display: none; }}
-                .mobile-layout {{ display: block; }}
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="desktop-layout">
-            <div class="card-column">
-                <div class="follow-banner">Follow <a href="https://x.com/FungoMLB" target="_blank">@FungoMLB</a> on X/Twitter!</div>
-                {left}
-            </div>
-            <div class="card-column">
-                <div class="follow-banner">Follow <a href="https://x.com/FungoMLB" target="_blank">@FungoMLB</a> on X/Twitter!</div>
-                {right}
-            </div>
-        </div>
-        <div class="mobile-layout">
-            {mobile_html}
-        </div>
-        <script>
-            function updateHeight() {{
-                var h = document.documentElement.scrollHeight;
-                window.parent.postMessage({{type: "streamlit:setFrameHeight", height: h}}, "*");
-            }}
-            window.addEventListener('load', updateHeight);
-            window.addEventListener('resize', updateHeight);
-            setTimeout(updateHeight, 200);
-            setTimeout(updateHeight, 800);
-        </script>
-    </body>
-    </html>
-    """
-
-    # Adjust height based on number of metrics
-    card_height = 750 if player_type == "Hitter" else 900
-    components.html(html, height=card_height, scrolling=True)
-
-    # Results stats section (desktop only — mobile has results built into the card)
-    st.markdown(
-        """
-    <style>
-        .desktop-results {{ }}
-        @media (max-width: 768px) {{ .desktop-results {{ display: none !important; }} }}
-    </style>
-    <div class="desktop-results" style="margin-top: 1.5rem; padding-top: 1.5rem; border-top: 1px solid #f0f0f0;">
-        <div style="font-family: 'DM Serif Display', serif; font-size: 1.25rem; color: #000; margin-bottom: 1rem; font-weight: 400;">Season Results</div>
-    </div>
-    """,
-        unsafe_allow_html=True,
-    )
-
-    results_html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <link href="https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;600;700&family=DM+Serif+Display&display=swap" rel="stylesheet">
-        <style>
-            * {{ margin:0; padding:0; box-sizing:border-box; }}
-            body {{
-                font-family: 'DM Sans', -apple-system, BlinkMacSystemFont, sans-serif;
-                background: transparent;
-            }}
-            .results-container {{
+            /* ── Season results (desktop only — mobile has them in the card) ── */
+            .desktop-results {
+                margin-top: 1.5rem;
+                padding-top: 1.5rem;
+                border-top: 1px solid #f0f0f0;
+            }
+            .desktop-results-title {
+                font-family: 'DM Serif Display', serif;
+                font-size: 1.25rem;
+                color: #000;
+                margin-bottom: 1rem;
+                font-weight: 400;
+            }
+            .results-container {
                 display: flex;
                 gap: 1.5rem;
-            }}
-            .results-card {{
+            }
+            .results-card {
                 flex: 1;
                 background: #fafafa;
                 border-radius: 12px;
                 padding: 1.25rem;
-            }}
-            .results-header {{
+            }
+            .results-header {
                 font-weight: 600;
                 color: #000;
                 margin-bottom: 1rem;
                 font-size: 0.95rem;
-            }}
-            .results-season {{
+            }
+            .results-season {
                 color: #666;
                 font-weight: 400;
-            }}
-            .results-grid {{
+            }
+            .results-grid {
                 display: flex;
                 flex-wrap: wrap;
                 gap: 0.5rem;
-            }}
-            .result-stat {{
+            }
+            .result-stat {
                 background: #fff;
                 border: 1px solid #e5e5e5;
                 border-radius: 8px;
                 padding: 0.75rem 1rem;
                 text-align: center;
                 min-width: 70px;
-            }}
-            .result-label {{
+            }
+            .result-label {
                 font-size: 0.7rem;
                 color: #999;
                 text-transform: uppercase;
                 letter-spacing: 0.05em;
                 margin-bottom: 0.25rem;
-            }}
-            .result-value {{
+            }
+            .result-value {
                 font-size: 1.1rem;
                 font-weight: 700;
                 color: #000;
-            }}
-            @media (max-width: 768px) {{
-                .results-container {{ display: none; }}
-            }}
+            }
+
+            /* ── Similarity score / section headers ── */
+            .sim-score-wrapper { text-align: center; padding: 0.5rem 0 1rem; }
+            .sim-score-label { font-size: 0.65rem; font-weight: 600; text-transform: uppercase; letter-spacing: 0.2em; color: #999; margin-bottom: 0.25rem; }
+            .sim-score-value { font-family: 'DM Serif Display', serif; font-size: 5rem; font-weight: 400; color: #000; line-height: 1; letter-spacing: -0.02em; }
+            .others-title {
+                margin-top: 2rem;
+                padding: 2rem 0 1.5rem;
+                border-top: 1px solid #f0f0f0;
+                font-family: 'DM Serif Display', serif;
+                font-size: 1.25rem;
+                color: #000;
+                font-weight: 400;
+            }
+
+            @media (max-width: 768px) {
+                .sim-score-wrapper { display: none; }
+                .desktop-layout { display: none; }
+                .desktop-results { display: none; }
+                .mobile-layout { display: block; }
+            }
         </style>
     </head>
-    <body>
-        <div class="results-container">
-            {render_results_section(target_player, player_type)}
-            {render_results_section(top, player_type)}
-        </div>
-        <script>
-            function updateHeight() {{
-                var h = document.documentElement.scrollHeight;
-                window.parent.postMessage({{type: "streamlit:setFrameHeight", height: h}}, "*");
-            }}
-            window.addEventListener('load', updateHeight);
-            window.addEventListener('resize', updateHeight);
-            setTimeout(updateHeight, 200);
-        </script>
+"""
+)
+
+_COMPARISON_TAIL = (
+    "        "
+    + FRAME_HEIGHT_SCRIPT
+    + """
     </body>
     </html>
     """
+)
+
+
+# The document is identical for every player type apart from the score, card
+# and results markup, so the fixed text between those fragments (score, left
+# card, right card, mobile table, target results, comp results, Other Similar
+# Seasons title) is joined up front
+_COMPARISON_SKELETON = (
+    _COMPARISON_HEAD
+    + """    <body>
+        <div class="sim-score-wrapper">
+            <div class="sim-score-label">Similarity Score</div>
+            <div class="sim-score-value">""",
+    """%</div>
+        </div>
+        <div class="desktop-layout">
+            <div class="card-column">
+                <div class="follow-banner">Follow <a href="https://x.com/FungoMLB" target="_blank">@FungoMLB</a> on X/Twitter!</div>
+                """,
+    """
+            </div>
+            <div class="card-column">
+                <div class="follow-banner">Follow <a href="https://x.com/FungoMLB" target="_blank">@FungoMLB</a> on X/Twitter!</div>
+                """,
+    """
+            </div>
+        </div>
+        <div class="mobile-layout">
+            """,
+    """
+        </div>
+        <div class="desktop-results">
+            <div class="desktop-results-title">Season Results</div>
+            <div class="results-container">
+                """,
+    """
+                """,
+    """
+            </div>
+        </div>
+""",
+    _COMPARISON_TAIL,
+)
 
-    # Adjust height based on player type (pitchers have more stats that wrap)
-    results_height = 160 if player_type == "Hitter" else 300
-    components.html(results_html, height=results_height, scrolling=True)
+_OTHERS_TITLE = """        <div class="others-title">Other Similar Seasons</div>
+"""
 
-    # Other similar players (clickable)
-    if len(similar_players) > 1:
-        st.markdown(
-            """
-        <div style="margin-top: 2rem; padding-top: 2rem; border-top: 1px solid #f0f0f0;">
-            <div style="font-family: 'DM Serif Display', serif; font-size: 1.25rem; color: #000; margin-bottom: 1.5rem; font-weight: 400;">Other Similar Seasons</div>
-        </div>
-        """,
-            unsafe_allow_html=True,
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _build_comparison_html(
+    target: Dict[str, Any],
+    comp: Dict[str, Any],
+    player_type: str,
+    show_others: bool = False,
+) -> str:
+    """Build the single iframe document (score, cards, season results) for a comparison.
+
+    Cached on the players' contents, so reruns that land on an already
+    viewed comp (e.g. switching between Other Similar Seasons) skip all
+    the HTML formatting.
+    """
+    # Cards HTML
+    left = render_player_card(
+        target, "target-card", is_comp=False, player_type=player_type
+    )
+    right = render_player_card(
+        comp, "comp-card", is_comp=True, player_type=player_type
+    )
+
+    # Mobile: unified comparison table
+    mobile_html = _build_mobile_comparison(target, comp, player_type)
+
+    skel = _COMPARISON_SKELETON
+    return "".join((
+        skel[0], f"{comp.get('similarity', 0):.1f}",
+        skel[1], left,
+        skel[2], right,
+        skel[3], mobile_html,
+        skel[4], render_results_section(target, player_type),
+        skel[5], render_results_section(comp, player_type),
+        skel[6], _OTHERS_TITLE if show_others else "",
+        skel[7],
+    ))
+
+
+def render_comparison(
+    target_player: Dict[str, Any],
+    similar_players: List[Dict[str, Any]],
+    player_type: str = "Hitter",
+) -> None:
+    """Render full comparison view."""
+    # Deferred: only pages that actually render a comparison need the iframe API
+    import streamlit.components.v1 as components
+
+    if not similar_players:
+        st.warning("No similar players found.")
+        return
+
+    # Store similar players in session state for clickable cards. The list
+    # comes out of st.cache_data as a fresh copy on every rerun, so key on the
+    # search itself and only write when the comp set actually changes.
+    comp_key = (target_player.get("mlbam_id"), target_player.get("season"), player_type)
+    if st.session_state.get("similar_players_key") != comp_key:
+        st.session_state.similar_players_key = comp_key
+        st.session_state.similar_players = similar_players
+        st.session_state.comp_button_labels = tuple(
+            f"**{p.get('name', 'Unknown')}**\n{p.get('season', '')}\n{p.get('similarity', 0):.1f}%"
+            for p in similar_players[1:6]
         )
 
-        # Create columns for clickable cards
-        cols = st.columns(min(5, len(similar_players) - 1))
-
-        for i, p in enumerate(similar_players[1:6], 1):
-            col_idx = i - 1
-            with cols[col_idx]:
-                player_name = p.get("name", "Unknown")
-                player_season = p.get("season", "")
-                sim_score = p.get("similarity", 0)
-
-                # Use a button to make it clickable
-                if st.button(
-                    f"**{player_name}**\n{player_season}\n{sim_score:.1f}%",
-                    key=f"comp_{i}",
-                    use_container_width=True,
-                ):
-                    st.session_state.selected_comp_index = i
-                    st.rerun()
+    if "selected_comp_index" not in st.session_state:
+        st.session_state.selected_comp_index = 0
+
+    top = similar_players[st.session_state.selected_comp_index]
+    has_others = len(similar_players) > 1
+
+    # Score, cards, results and the Other Similar Seasons title all live in
+    # the one iframe; only the comp buttons stay as native widgets
+    html = _build_comparison_html(target_player, top, player_type, has_others)
+
+    frame_height = _FRAME_HEIGHTS.get(player_type, _FRAME_HEIGHTS["Pitcher"])
+    components.html(html, height=frame_height, scrolling=True)
+
+    # Other similar players (clickable)
+    if has_others:
+        _render_similar_grid(similar_players)
+
+
+@st.fragment
+def _render_similar_grid(similar_players: List[Dict[str, Any]]) -> None:
+    """Render the "Other Similar Seasons" buttons.
+
+    As a fragment, a click reruns only this grid; the st.rerun() that follows
+    then runs the app once with the new selection instead of twice. The
+    section title is drawn at the bottom of the comparison iframe.
+    """
+    # Create columns for clickable cards
+    cols = st.columns(min(5, len(similar_players) - 1))
+
+    for i, label in enumerate(st.session_state.comp_button_labels, 1):
+        with cols[i - 1]:
+            # Use a button to make it clickable
+            if st.button(label, key=f"comp_{i}", use_container_width=True):
+                st.session_state.selected_comp_index = i
+                st.rerun()
@@ -1,140 +1,87 @@
 """Pitch Model comparison view — per-pitch-type similarity UI."""
 
-from typing import Dict, List, Any
+from html import escape
+from typing import Dict, List, Any, Tuple
 import streamlit as st
 import streamlit.components.v1 as components
 
 from .comparison_view import get_player_photo_url
+from .styles import FONT_LINK, FRAME_HEIGHT_SCRIPT
 
 
 # Metrics shown in the arsenal overview table
 OVERVIEW_METRICS = [
-    ("avg_velo", "Velo", "{:.1f}"),
-    ("avg_ivb", "IVB", "{:.1f}"),
-    ("avg_ihb", "IHB", "{:.1f}"),
-    ("avg_spin", "Spin", "{:.0f}"),
-    ("stuff_plus", "Stf+", "{:.0f}"),
+    ("avg_velo", "Velo", "{:.1f}".format),
+    ("avg_ivb", "IVB", "{:.1f}".format),
+    ("avg_ihb", "IHB", "{:.1f}".format),
+    ("avg_spin", "Spin", "{:.0f}".format),
+    ("stuff_plus", "Stf+", "{:.0f}".format),
 ]
 
 # Full comp card metrics for the detailed section
 COMP_METRICS = [
-    ("avg_velo", "Velo", "{:.1f}", " mph"),
-    ("avg_ivb", "IVB", "{:.1f}", '"'),
-    ("avg_ihb", "IHB", "{:.1f}", '"'),
-    ("avg_spin", "Spin", "{:.0f}", ""),
-    ("stuff_plus", "Stf+", "{:.0f}", ""),
-    ("whiff_pct", "Whiff%", "{:.1f}", "%"),
-    ("chase_pct", "Chase%", "{:.1f}", "%"),
-    ("zone_pct", "Zone%", "{:.1f}", "%"),
+    ("avg_velo", "Velo", "{:.1f}".format, " mph"),
+    ("avg_ivb", "IVB", "{:.1f}".format, '"'),
+    ("avg_ihb", "IHB", "{:.1f}".format, '"'),
+    ("avg_spin", "Spin", "{:.0f}".format, ""),
+    ("stuff_plus", "Stf+", "{:.0f}".format, ""),
+    ("whiff_pct", "Whiff%", "{:.1f}".format, "%"),
+    ("chase_pct", "Chase%", "{:.1f}".format, "%"),
+    ("zone_pct", "Zone%", "{:.1f}".format, "%"),
 ]
 
 
-def _format_val(value, fmt, suffix=""):
-    """Format a metric value or return dash if missing."""
-    if value is None or str(value) == "nan":
-        return "—"
-    return f"{fmt.format(value)}{suffix}"
-
-
-def _render_arsenal_overview(
-    pitcher_info: Dict[str, Any],
-    pitches: List[Dict[str, Any]],
-    similar_pitches: Dict[str, List[Dict[str, Any]]],
-) -> None:
-    """Render the screenshot-friendly arsenal overview card."""
-    name = pitcher_info.get("name", "Unknown")
-    season = pitcher_info.get("season", "")
-    mlbam_id = pitcher_info.get("mlbam_id", 0)
-    arm_angle = pitcher_info.get("arm_angle")
-    photo_url = get_player_photo_url(mlbam_id)
+def _is_missing(value) -> bool:
+    """True for None and NaN (the only value not equal to itself)."""
+    return value is None or value != value
 
-    arm_angle_str = f"Arm Angle: {arm_angle:.1f}°" if arm_angle else ""
-    separator = "  ·  " if arm_angle else ""
-
-    # Build pitch rows
-    pitch_rows_html = ""
-    for pitch in pitches:
-        pt = pitch.get("pitch_type", "")
-        pn = pitch.get("pitch_name", pt)
 
-        # Metric cells
-        metric_cells = ""
-        for metric, _, fmt in OVERVIEW_METRICS:
-            val = pitch.get(metric)
-            metric_cells += f'<td class="ar-metric">{_format_val(val, fmt)}</td>'
-
-        # Comp line with photo, name, and their stats
-        matches = similar_pitches.get(pt, [])
-        comp_html = ""
-        if matches:
-            m = matches[0]
-            comp_name = m.get("name", "Unknown")
-            comp_season = m.get("season", "")
-            similarity = m.get("similarity", 0)
-            comp_mlbam = m.get("mlbam_id", 0)
-            comp_photo = get_player_photo_url(comp_mlbam)
-
-            # Comp's stats in the same columns
-            comp_metric_cells = ""
-            for metric, _, fmt in OVERVIEW_METRICS:
-                val = m.get(metric)
-                comp_metric_cells += f'<td class="ar-comp-metric">{_format_val(val, fmt)}</td>'
+def _format_val(value, fmt, suffix=""):
+    """Format a metric value with a bound formatter, or return dash if missing."""
+    if _is_missing(value):
+        return "—"
+    return f"{fmt(value)}{suffix}"
 
-            comp_html = f"""
-            <tr class="ar-comp-row">
-                <td class="ar-comp-sim-cell"><span class="ar-comp-sim">{similarity:.1f}%</span></td>
-                <td class="ar-comp-name-cell">
-                    <div class="ar-comp-info">
-                        <img src="{comp_photo}" class="ar-comp-photo" onerror="this.style.display='none'">
-                        <span class="ar-comp-name">{comp_name}</span>
-                        <span class="ar-comp-season">{comp_season}</span>
-                    </div>
-                </td>
-                {comp_metric_cells}
-            </tr>
-            """
 
-        pitch_rows_html += f"""
-        <tr class="ar-pitch-row">
-            <td class="ar-badge-cell"><span class="ar-badge">{pt}</span></td>
-            <td class="ar-name-cell">{pn}</td>
-            {metric_cells}
-        </tr>
-        {comp_html}
-        """
+# (key, formatter) pairs for the overview cells, unpacked once
+_OVERVIEW_CELLS = tuple((metric, fmt) for metric, _, fmt in OVERVIEW_METRICS)
 
-    # Build metric header cells
-    metric_headers = ""
-    for _, label, _ in OVERVIEW_METRICS:
-        metric_headers += f'<th class="ar-metric-header">{label}</th>'
+# Metric header cells are fixed by OVERVIEW_METRICS
+_ARSENAL_METRIC_HEADERS = "".join(
+    f'<th class="ar-metric-header">{label}</th>' for _, label, _ in OVERVIEW_METRICS
+)
 
-    html = f"""
+# Document head (fonts + CSS) for the pitch model view; only the body varies
+_PITCH_MODEL_HEAD = (
+    """
     <!DOCTYPE html>
     <html>
     <head>
-        <link href="https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;600;700&family=DM+Serif+Display&display=swap" rel="stylesheet">
+        """
+    + FONT_LINK
+    + """
         <style>
-            * {{ margin:0; padding:0; box-sizing:border-box; }}
-            body {{
+            * { margin:0; padding:0; box-sizing:border-box; }
+            body {
                 font-family: 'DM Sans', -apple-system, BlinkMacSystemFont, sans-serif;
                 background: transparent;
-            }}
-            .follow-banner {{
+            }
+            .follow-banner {
                 text-align: center;
                 font-size: 0.75rem;
                 font-weight: 600;
                 color: #666;
                 margin-bottom: 0.5rem;
                 letter-spacing: 0.02em;
-            }}
-            .follow-banner a {{
+            }
+            .follow-banner a {
                 color: #1e2a5a;
                 text-decoration: none;
-            }}
-            .follow-banner a:hover {{
+            }
+            .follow-banner a:hover {
                 text-decoration: underline;
-            }}
-            .arsenal-card {{
+            }
+            .arsenal-card {
                 background: #fff;
                 border: 1px solid #e0e0e0;
                 border-radius: 16px;
@@ -142,15 +89,15 @@ def _render_arsenal_overview(
                 box-shadow: 0 2px 12px rgba(0,0,0,0.06);
                 max-width: 680px;
                 margin: 0 auto;
-            }}
-            .arsenal-header {{
+            }
+            .arsenal-header {
                 background: #1e3a5f;
                 padding: 1.25rem 1.5rem;
                 display: flex;
                 align-items: center;
                 gap: 1rem;
-            }}
-            .arsenal-photo {{
+            }
+            .arsenal-photo {
                 width: 60px;
                 height: 60px;
                 border-radius: 50%;
@@ -158,41 +105,41 @@ def _render_arsenal_overview(
                 background: #2a4a6f;
                 flex-shrink: 0;
                 border: 2px solid #3a5a7f;
-            }}
-            .arsenal-photo img {{
+            }
+            .arsenal-photo img {
                 width: 100%;
                 height: 100%;
                 object-fit: cover;
-            }}
-            .arsenal-info {{
+            }
+            .arsenal-info {
                 flex: 1;
-            }}
-            .arsenal-label {{
+            }
+            .arsenal-label {
                 font-size: 0.65rem;
                 font-weight: 600;
                 text-transform: uppercase;
                 letter-spacing: 0.1em;
                 color: #a0c4e8;
                 margin-bottom: 0.15rem;
-            }}
-            .arsenal-name {{
+            }
+            .arsenal-name {
                 font-family: 'DM Serif Display', serif;
                 font-size: 1.4rem;
                 color: #fff;
                 letter-spacing: -0.02em;
-            }}
-            .arsenal-meta {{
+            }
+            .arsenal-meta {
                 font-size: 0.85rem;
                 color: #a0c4e8;
                 font-weight: 500;
-            }}
+            }
 
             /* Arsenal table */
-            .arsenal-table {{
+            .arsenal-table {
                 width: 100%;
                 border-collapse: collapse;
-            }}
-            .ar-header-row th {{
+            }
+            .ar-header-row th {
                 padding: 0.6rem 0.5rem 0.4rem;
                 font-size: 0.65rem;
                 font-weight: 600;
@@ -200,24 +147,24 @@ def _render_arsenal_overview(
                 letter-spacing: 0.08em;
                 color: #999;
                 border-bottom: 1px solid #eee;
-            }}
-            .ar-header-row th:first-child {{
+            }
+            .ar-header-row th:first-child {
                 padding-left: 1.25rem;
-            }}
-            .ar-metric-header {{
+            }
+            .ar-metric-header {
                 text-align: right;
                 width: 60px;
-            }}
-            .ar-pitch-row td {{
+            }
+            .ar-pitch-row td {
                 padding: 0.55rem 0.5rem;
                 border-bottom: none;
                 vertical-align: middle;
-            }}
-            .ar-pitch-row td:first-child {{
+            }
+            .ar-pitch-row td:first-child {
                 padding-left: 1.25rem;
                 width: 50px;
-            }}
-            .ar-badge {{
+            }
+            .ar-badge {
                 background: #1e3a5f;
                 color: #fff;
                 font-size: 0.65rem;
@@ -226,45 +173,45 @@ def _render_arsenal_overview(
                 border-radius: 4px;
                 letter-spacing: 0.05em;
                 white-space: nowrap;
-            }}
-            .ar-name-cell {{
+            }
+            .ar-name-cell {
                 font-size: 0.85rem;
                 font-weight: 500;
                 color: #444;
                 padding-left: 0.25rem !important;
-            }}
-            .ar-metric {{
+            }
+            .ar-metric {
                 text-align: right;
                 font-size: 0.85rem;
                 font-weight: 600;
                 color: #222;
                 font-variant-numeric: tabular-nums;
                 width: 60px;
-            }}
-            .ar-comp-row td {{
+            }
+            .ar-comp-row td {
                 padding: 0.1rem 0.5rem 0.65rem;
                 border-bottom: 1px solid #f0f0f0;
-            }}
-            .ar-comp-row td:first-child {{
+            }
+            .ar-comp-row td:first-child {
                 padding-left: 1.25rem;
-            }}
-            .ar-comp-sim-cell {{
+            }
+            .ar-comp-sim-cell {
                 padding-left: 1.25rem;
                 width: 50px;
                 vertical-align: middle;
-            }}
-            .ar-comp-sim {{
+            }
+            .ar-comp-sim {
                 font-size: 0.7rem;
                 font-weight: 700;
                 color: #1e3a5f;
                 white-space: nowrap;
-            }}
-            .ar-comp-info {{
+            }
+            .ar-comp-info {
                 display: flex;
                 align-items: center;
                 gap: 0.5rem;
-            }}
-            .ar-comp-photo {{
+            }
+            .ar-comp-photo {
                 width: 28px;
                 height: 28px;
                 border-radius: 50%;
@@ -272,233 +219,121 @@ def _render_arsenal_overview(
                 background: #f0f0f0;
                 border: 1px solid #e0e0e0;
                 flex-shrink: 0;
-            }}
-            .ar-comp-name {{
+            }
+            .ar-comp-name {
                 font-size: 0.85rem;
                 font-weight: 700;
                 color: #1e3a5f;
-            }}
-            .ar-comp-season {{
+            }
+            .ar-comp-season {
                 font-size: 0.75rem;
                 color: #999;
                 font-weight: 500;
-            }}
-            .ar-comp-metric {{
+            }
+            .ar-comp-metric {
                 text-align: right;
                 font-size: 0.78rem;
                 font-weight: 500;
                 color: #999;
                 font-variant-numeric: tabular-nums;
                 width: 60px;
-            }}
+            }
             /* Last comp row: no bottom border */
             .arsenal-table tr.ar-comp-row:last-child td,
-            .arsenal-table tr.ar-pitch-row:last-child td {{
+            .arsenal-table tr.ar-pitch-row:last-child td {
                 border-bottom: none;
-            }}
+            }
 
             /* Mobile: compact layout for phones */
-            @media (max-width: 768px) {{
-                .arsenal-card {{
+            @media (max-width: 768px) {
+                .arsenal-card {
                     max-width: 100%;
                     border-radius: 10px;
-                }}
-                .arsenal-header {{
+                }
+                .arsenal-header {
                     padding: 0.85rem 1rem;
                     gap: 0.75rem;
-                }}
-                .arsenal-photo {{
+                }
+                .arsenal-photo {
                     width: 44px;
                     height: 44px;
-                }}
-                .arsenal-name {{
+                }
+                .arsenal-name {
                     font-size: 1.1rem;
-                }}
-                .arsenal-meta {{
+                }
+                .arsenal-meta {
                     font-size: 0.75rem;
-                }}
-                .ar-header-row th {{
+                }
+                .ar-header-row th {
                     font-size: 0.55rem;
                     padding: 0.4rem 0.25rem 0.3rem;
-                }}
-                .ar-metric-header {{
+                }
+                .ar-metric-header {
                     width: 42px;
-                }}
-                .ar-pitch-row td {{
+                }
+                .ar-pitch-row td {
                     padding: 0.4rem 0.25rem;
-                }}
-                .ar-badge {{
+                }
+                .ar-badge {
                     font-size: 0.55rem;
                     padding: 0.15rem 0.35rem;
-                }}
-                .ar-name-cell {{
+                }
+                .ar-name-cell {
                     font-size: 0.72rem;
-                }}
-                .ar-metric {{
+                }
+                .ar-metric {
                     font-size: 0.72rem;
                     width: 42px;
-                }}
-                .ar-comp-row td {{
+                }
+                .ar-comp-row td {
                     padding: 0.05rem 0.25rem 0.5rem;
-                }}
-                .ar-comp-photo {{
+                }
+                .ar-comp-photo {
                     width: 22px;
                     height: 22px;
-                }}
-                .ar-comp-name {{
+                }
+                .ar-comp-name {
                     font-size: 0.7rem;
-                }}
-                .ar-comp-season {{
+                }
+                .ar-comp-season {
                     font-size: 0.6rem;
-                }}
-                .ar-comp-metric {{
+                }
+                .ar-comp-metric {
                     font-size: 0.65rem;
                     width: 42px;
-                }}
-                .ar-comp-sim {{
+                }
+                .ar-comp-sim {
                     font-size: 0.6rem;
-                }}
-                .follow-banner {{
+                }
+                .follow-banner {
                     font-size: 0.65rem;
-                }}
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="follow-banner">Follow <a href="https://x.com/FungoMLB" target="_blank">@FungoMLB</a> on X/Twitter!</div>
-        <div class="arsenal-card">
-            <div class="arsenal-header">
-                <div class="arsenal-photo">
-                    <img src="{photo_url}" alt="{name}" onerror="this.style.display='none'">
-                </div>
-                <div class="arsenal-info">
-                    <div class="arsenal-label">Pitch Arsenal</div>
-                    <div class="arsenal-name">{name}</div>
-                    <div class="arsenal-meta">{season}{separator}{arm_angle_str}</div>
-                </div>
-            </div>
-            <table class="arsenal-table">
-                <tr class="ar-header-row">
-                    <th></th>
-                    <th style="text-align:left;">Pitch</th>
-                    {metric_headers}
-                </tr>
-                {pitch_rows_html}
-            </table>
-        </div>
-        <script>
-            function updateHeight() {{
-                var h = document.documentElement.scrollHeight;
-                window.parent.postMessage({{type: "streamlit:setFrameHeight", height: h}}, "*");
-            }}
-            window.addEventListener('load', updateHeight);
-            window.addEventListener('resize', updateHeight);
-            setTimeout(updateHeight, 200);
-            setTimeout(updateHeight, 800);
-        </script>
-    </body>
-    </html>
-    """
-
-    n_pitches = len(pitches)
-    height = 150 + n_pitches * 90
-    components.html(html, height=height, scrolling=True)
-
-
-def _render_detailed_comps(
-    pitches: List[Dict[str, Any]],
-    similar_pitches: Dict[str, List[Dict[str, Any]]],
-) -> None:
-    """Render detailed comparison cards — one row per pitch, up to 4 comps across."""
-    pitch_sections_html = ""
-    for pitch in pitches:
-        pt = pitch.get("pitch_type", "")
-        pn = pitch.get("pitch_name", pt)
-        matches = similar_pitches.get(pt, [])
-        if not matches:
-            continue
-
-        # Build comp cards for this pitch type (up to 4)
-        cards_html = ""
-        for match in matches[:4]:
-            match_name = match.get("name", "Unknown")
-            match_season = match.get("season", "")
-            similarity = match.get("similarity", 0)
-            match_mlbam = match.get("mlbam_id", 0)
-            photo_url = get_player_photo_url(match_mlbam)
-
-            # Build metric rows
-            metrics_html = ""
-            for metric, label, fmt, suffix in COMP_METRICS:
-                target_val = pitch.get(metric)
-                match_val = match.get(metric)
-                t_str = _format_val(target_val, fmt, suffix)
-                m_str = _format_val(match_val, fmt, suffix)
-                metrics_html += f"""
-                <div class="dc-metric-row">
-                    <span class="dc-metric-label">{label}</span>
-                    <span class="dc-metric-val dc-target">{t_str}</span>
-                    <span class="dc-metric-arrow">→</span>
-                    <span class="dc-metric-val dc-match">{m_str}</span>
-                </div>
-                """
-
-            cards_html += f"""
-            <div class="dc-card">
-                <div class="dc-match-info">
-                    <img src="{photo_url}" class="dc-photo" onerror="this.style.display='none'">
-                    <div class="dc-match-details">
-                        <div class="dc-match-name">{match_name}</div>
-                        <div class="dc-match-season">{match_season}</div>
-                    </div>
-                    <span class="dc-similarity">{similarity:.1f}%</span>
-                </div>
-                <div class="dc-header-labels">
-                    <span class="dc-hl-spacer"></span>
-                    <span class="dc-hl-label">Target</span>
-                    <span class="dc-hl-spacer-sm"></span>
-                    <span class="dc-hl-label">Comp</span>
-                </div>
-                <div class="dc-metrics">{metrics_html}</div>
-            </div>
-            """
-
-        pitch_sections_html += f"""
-        <div class="dc-pitch-section">
-            <div class="dc-pitch-header">
-                <span class="dc-badge">{pt}</span>
-                <span class="dc-pitch-name">{pn}</span>
-            </div>
-            <div class="dc-row">
-                {cards_html}
-            </div>
-        </div>
-        """
-
-    if not pitch_sections_html:
-        return
-
-    html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <link href="https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;600;700&family=DM+Serif+Display&display=swap" rel="stylesheet">
-        <style>
-            * {{ margin:0; padding:0; box-sizing:border-box; }}
-            body {{
-                font-family: 'DM Sans', -apple-system, BlinkMacSystemFont, sans-serif;
-                background: transparent;
-            }}
-            .dc-pitch-section {{
+                }
+            }
+            /* ── Detailed comparisons (collapsed by default) ── */
+            .dc-details {
+                margin-top: 2rem;
+            }
+            .dc-details > summary {
+                font-family: 'DM Serif Display', serif;
+                font-size: 1.25rem;
+                color: #000;
+                cursor: pointer;
+                padding: 0.75rem 0;
+                border-top: 1px solid #f0f0f0;
+            }
+            .dc-details[open] > summary {
+                margin-bottom: 1rem;
+            }
+            .dc-pitch-section {
                 margin-bottom: 1.25rem;
-            }}
-            .dc-pitch-header {{
+            }
+            .dc-pitch-header {
                 display: flex;
                 align-items: center;
                 gap: 0.5rem;
                 margin-bottom: 0.6rem;
-            }}
-            .dc-badge {{
+            }
+            .dc-badge {
                 background: #1e3a5f;
                 color: #fff;
                 font-size: 0.65rem;
@@ -506,33 +341,33 @@ def _render_detailed_comps(
                 padding: 0.2rem 0.45rem;
                 border-radius: 4px;
                 letter-spacing: 0.05em;
-            }}
-            .dc-pitch-name {{
+            }
+            .dc-pitch-name {
                 font-weight: 600;
                 font-size: 0.95rem;
                 color: #333;
-            }}
-            .dc-row {{
+            }
+            .dc-row {
                 display: grid;
                 grid-template-columns: repeat(4, 1fr);
                 gap: 0.75rem;
-            }}
-            .dc-card {{
+            }
+            .dc-card {
                 background: #fff;
                 border: 1px solid #e0e0e0;
                 border-radius: 10px;
                 padding: 0.85rem 1rem;
                 box-shadow: 0 2px 8px rgba(0,0,0,0.04);
-            }}
-            .dc-match-info {{
+            }
+            .dc-match-info {
                 display: flex;
                 align-items: center;
                 gap: 0.6rem;
                 margin-bottom: 0.65rem;
                 padding-bottom: 0.55rem;
                 border-bottom: 1px solid #f0f0f0;
-            }}
-            .dc-photo {{
+            }
+            .dc-photo {
                 width: 36px;
                 height: 36px;
                 border-radius: 50%;
@@ -540,43 +375,43 @@ def _render_detailed_comps(
                 background: #f0f0f0;
                 border: 1px solid #e5e5e5;
                 flex-shrink: 0;
-            }}
-            .dc-match-details {{
+            }
+            .dc-match-details {
                 flex: 1;
                 min-width: 0;
-            }}
-            .dc-match-name {{
+            }
+            .dc-match-name {
                 font-weight: 600;
                 font-size: 0.82rem;
                 color: #000;
                 white-space: nowrap;
                 overflow: hidden;
                 text-overflow: ellipsis;
-            }}
-            .dc-match-season {{
+            }
+            .dc-match-season {
                 font-size: 0.72rem;
                 color: #666;
-            }}
-            .dc-similarity {{
+            }
+            .dc-similarity {
                 font-family: 'DM Serif Display', serif;
                 font-size: 1rem;
                 color: #1e3a5f;
                 flex-shrink: 0;
-            }}
-            .dc-header-labels {{
+            }
+            .dc-header-labels {
                 display: flex;
                 align-items: center;
                 margin-bottom: 0.2rem;
-            }}
-            .dc-hl-spacer {{
+            }
+            .dc-hl-spacer {
                 width: 48px;
                 flex-shrink: 0;
-            }}
-            .dc-hl-spacer-sm {{
+            }
+            .dc-hl-spacer-sm {
                 width: 24px;
                 flex-shrink: 0;
-            }}
-            .dc-hl-label {{
+            }
+            .dc-hl-label {
                 width: 58px;
                 text-align: right;
                 font-size: 0.6rem;
@@ -585,116 +420,324 @@ def _render_detailed_comps(
                 letter-spacing: 0.08em;
                 color: #aaa;
                 flex-shrink: 0;
-            }}
-            .dc-metrics {{
+            }
+            .dc-metrics {
                 display: flex;
                 flex-direction: column;
                 gap: 0.1rem;
-            }}
-            .dc-metric-row {{
+            }
+            .dc-metric-row {
                 display: flex;
                 align-items: center;
                 font-size: 0.75rem;
                 padding: 0.12rem 0;
-            }}
-            .dc-metric-label {{
+            }
+            .dc-metric-label {
                 width: 48px;
                 color: #999;
                 font-weight: 500;
                 flex-shrink: 0;
-            }}
-            .dc-metric-val {{
+            }
+            .dc-metric-val {
                 width: 58px;
                 text-align: right;
                 font-weight: 600;
                 flex-shrink: 0;
                 font-variant-numeric: tabular-nums;
-            }}
-            .dc-target {{
+            }
+            .dc-target {
                 color: #666;
-            }}
-            .dc-match {{
+            }
+            .dc-match {
                 color: #000;
-            }}
-            .dc-metric-arrow {{
+            }
+            .dc-metric-arrow {
                 width: 24px;
                 text-align: center;
                 color: #ccc;
                 flex-shrink: 0;
-            }}
+            }
 
             /* Mobile: stack comp cards vertically */
-            @media (max-width: 768px) {{
-                .dc-row {{
+            @media (max-width: 768px) {
+                .dc-row {
                     grid-template-columns: 1fr 1fr;
                     gap: 0.5rem;
-                }}
-                .dc-card {{
+                }
+                .dc-card {
                     padding: 0.65rem 0.75rem;
-                }}
-                .dc-photo {{
+                }
+                .dc-photo {
                     width: 28px;
                     height: 28px;
-                }}
-                .dc-match-name {{
+                }
+                .dc-match-name {
                     font-size: 0.72rem;
-                }}
-                .dc-match-season {{
+                }
+                .dc-match-season {
                     font-size: 0.65rem;
-                }}
-                .dc-similarity {{
+                }
+                .dc-similarity {
                     font-size: 0.85rem;
-                }}
-                .dc-metric-row {{
+                }
+                .dc-metric-row {
                     font-size: 0.65rem;
-                }}
-                .dc-metric-label {{
+                }
+                .dc-metric-label {
                     width: 36px;
-                }}
-                .dc-metric-val {{
+                }
+                .dc-metric-val {
                     width: 46px;
-                }}
-                .dc-metric-arrow {{
+                }
+                .dc-metric-arrow {
                     width: 16px;
-                }}
-                .dc-hl-spacer {{
+                }
+                .dc-hl-spacer {
                     width: 36px;
-                }}
-                .dc-hl-spacer-sm {{
+                }
+                .dc-hl-spacer-sm {
                     width: 16px;
-                }}
-                .dc-hl-label {{
+                }
+                .dc-hl-label {
                     width: 46px;
                     font-size: 0.5rem;
-                }}
-                .dc-badge {{
+                }
+                .dc-badge {
                     font-size: 0.55rem;
-                }}
-                .dc-pitch-name {{
+                }
+                .dc-pitch-name {
                     font-size: 0.82rem;
-                }}
-            }}
+                }
+            }
         </style>
     </head>
-    <body>
-        {pitch_sections_html}
-        <script>
-            function updateHeight() {{
-                var h = document.documentElement.scrollHeight;
-                window.parent.postMessage({{type: "streamlit:setFrameHeight", height: h}}, "*");
-            }}
-            window.addEventListener('load', updateHeight);
-            window.addEventListener('resize', updateHeight);
-            setTimeout(updateHeight, 200);
-            setTimeout(updateHeight, 800);
-        </script>
+"""
+)
+
+
+def _build_arsenal_html(
+    pitcher_info: Dict[str, Any],
+    pitches: List[Dict[str, Any]],
+    similar_pitches: Dict[str, List[Dict[str, Any]]],
+) -> Tuple[str, int]:
+    """Build the screenshot-friendly arsenal overview card markup and its row count."""
+    # Names go into markup, so escape them once (O'Neill, &, etc.)
+    name = escape(pitcher_info.get("name", "Unknown"))
+    season = pitcher_info.get("season", "")
+    mlbam_id = pitcher_info.get("mlbam_id", 0)
+    arm_angle = pitcher_info.get("arm_angle")
+    photo_url = get_player_photo_url(mlbam_id)
+
+    arm_angle_str = f"Arm Angle: {arm_angle:.1f}°" if arm_angle else ""
+    separator = "  ·  " if arm_angle else ""
+
+    # Build pitch rows
+    pitch_rows = []
+    for pitch in pitches:
+        pget = pitch.get
+        pt = pget("pitch_type", "")
+        matches = similar_pitches.get(pt, [])
+
+        # A pitch with no comp and no measured metrics would only be an
+        # empty row of dashes
+        if not matches and all(_is_missing(pget(metric)) for metric, _ in _OVERVIEW_CELLS):
+            continue
+
+        pn = escape(str(pget("pitch_name", pt)))
+
+        # Metric cells
+        metric_cells = "".join(
+            f'<td class="ar-metric">{_format_val(pget(metric), fmt)}</td>'
+            for metric, fmt in _OVERVIEW_CELLS
+        )
+
+        # Comp line with photo, name, and their stats
+        comp_html = ""
+        if matches:
+            m = matches[0]
+            comp_name = escape(m.get("name", "Unknown"))
+            comp_season = m.get("season", "")
+            similarity = m.get("similarity", 0)
+            comp_mlbam = m.get("mlbam_id", 0)
+            comp_photo = get_player_photo_url(comp_mlbam)
+
+            # Comp's stats in the same columns
+            mget = m.get
+            comp_metric_cells = "".join(
+                f'<td class="ar-comp-metric">{_format_val(mget(metric), fmt)}</td>'
+                for metric, fmt in _OVERVIEW_CELLS
+            )
+
+            comp_html = f"""
+            <tr class="ar-comp-row">
+                <td class="ar-comp-sim-cell"><span class="ar-comp-sim">{similarity:.1f}%</span></td>
+                <td class="ar-comp-name-cell">
+                    <div class="ar-comp-info">
+                        <img src="{comp_photo}" class="ar-comp-photo" onerror="this.style.display='none'">
+                        <span class="ar-comp-name">{comp_name}</span>
+                        <span class="ar-comp-season">{comp_season}</span>
+                    </div>
+                </td>
+                {comp_metric_cells}
+            </tr>
+            """
+
+        pitch_rows.append(f"""
+        <tr class="ar-pitch-row">
+            <td class="ar-badge-cell"><span class="ar-badge">{pt}</span></td>
+            <td class="ar-name-cell">{pn}</td>
+            {metric_cells}
+        </tr>
+        {comp_html}
+        """)
+    pitch_rows_html = "".join(pitch_rows)
+
+    html = f"""
+        <div class="follow-banner">Follow <a href="https://x.com/FungoMLB" target="_blank">@FungoMLB</a> on X/Twitter!</div>
+        <div class="arsenal-card">
+            <div class="arsenal-header">
+                <div class="arsenal-photo">
+                    <img src="{photo_url}" alt="{name}" onerror="this.style.display='none'">
+                </div>
+                <div class="arsenal-info">
+                    <div class="arsenal-label">Pitch Arsenal</div>
+                    <div class="arsenal-name">{name}</div>
+                    <div class="arsenal-meta">{season}{separator}{arm_angle_str}</div>
+                </div>
+            </div>
+            <table class="arsenal-table">
+                <tr class="ar-header-row">
+                    <th></th>
+                    <th style="text-align:left;">Pitch</th>
+                    {_ARSENAL_METRIC_HEADERS}
+                </tr>
+                {pitch_rows_html}
+            </table>
+        </div>
+    """
+    return html, len(pitch_rows)
+
+
+# Detailed comp card markup, filled with str.format. Metric rows are split
+# at the target value so the target half can be shared across a pitch's comps.
+_DC_ROW_HEAD_TMPL = """
+                <div class="dc-metric-row">
+                    <span class="dc-metric-label">{label}</span>
+                    <span class="dc-metric-val dc-target">{t_val}</span>"""
+
+_DC_ROW_TAIL_TMPL = """
+                    <span class="dc-metric-arrow">→</span>
+                    <span class="dc-metric-val dc-match">{m_val}</span>
+                </div>
+                """
+
+_DC_CARD_TMPL = """
+            <div class="dc-card">
+                <div class="dc-match-info">
+                    <img src="{photo_url}" class="dc-photo" onerror="this.style.display='none'">
+                    <div class="dc-match-details">
+                        <div class="dc-match-name">{name}</div>
+                        <div class="dc-match-season">{season}</div>
+                    </div>
+                    <span class="dc-similarity">{similarity:.1f}%</span>
+                </div>
+                <div class="dc-header-labels">
+                    <span class="dc-hl-spacer"></span>
+                    <span class="dc-hl-label">Target</span>
+                    <span class="dc-hl-spacer-sm"></span>
+                    <span class="dc-hl-label">Comp</span>
+                </div>
+                <div class="dc-metrics">{metrics_html}</div>
+            </div>
+            """
+
+
+def _build_detailed_html(
+    pitches: List[Dict[str, Any]],
+    similar_pitches: Dict[str, List[Dict[str, Any]]],
+) -> str:
+    """Build the detailed comparison cards — one row per pitch, up to 4 comps across ("" if none)."""
+    pitch_sections = []
+    for pitch in pitches:
+        pt = pitch.get("pitch_type", "")
+        pn = escape(str(pitch.get("pitch_name", pt)))
+        matches = similar_pitches.get(pt, [])
+        if not matches:
+            continue
+
+        # The target side of each metric row is the same for every comp card,
+        # so format it once per pitch
+        row_heads = [
+            _DC_ROW_HEAD_TMPL.format(label=label, t_val=_format_val(pitch.get(metric), fmt, suffix))
+            for metric, label, fmt, suffix in COMP_METRICS
+        ]
+
+        # Build comp cards for this pitch type (up to 4)
+        cards = []
+        for match in matches[:4]:
+            mget = match.get
+            metrics_html = "".join(
+                head + _DC_ROW_TAIL_TMPL.format(m_val=_format_val(mget(metric), fmt, suffix))
+                for head, (metric, _, fmt, suffix) in zip(row_heads, COMP_METRICS)
+            )
+            cards.append(
+                _DC_CARD_TMPL.format(
+                    photo_url=get_player_photo_url(mget("mlbam_id", 0)),
+                    name=escape(mget("name", "Unknown")),
+                    season=mget("season", ""),
+                    similarity=mget("similarity", 0),
+                    metrics_html=metrics_html,
+                )
+            )
+        cards_html = "".join(cards)
+
+        pitch_sections.append(f"""
+        <div class="dc-pitch-section">
+            <div class="dc-pitch-header">
+                <span class="dc-badge">{pt}</span>
+                <span class="dc-pitch-name">{pn}</span>
+            </div>
+            <div class="dc-row">
+                {cards_html}
+            </div>
+        </div>
+        """)
+
+    return "".join(pitch_sections)
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _build_pitch_model_html(
+    pitcher_info: Dict[str, Any],
+    pitches: List[Dict[str, Any]],
+    similar_pitches: Dict[str, List[Dict[str, Any]]],
+) -> Tuple[str, int]:
+    """Build the single pitch model document and its initial frame height.
+
+    Cached on the inputs' contents, so reruns for the same pitcher-season
+    reuse the HTML. The detailed comps sit in a collapsed <details>; the
+    frame resizes itself when it is opened.
+    """
+    arsenal_html, n_rows = _build_arsenal_html(pitcher_info, pitches, similar_pitches)
+    detailed_html = _build_detailed_html(pitches, similar_pitches)
+    if detailed_html:
+        detailed_html = f"""
+        <details class="dc-details">
+            <summary>Detailed Comparisons</summary>
+            {detailed_html}
+        </details>
+        """
+
+    html = _PITCH_MODEL_HEAD + f"""    <body>
+        {arsenal_html}
+        {detailed_html}
+        {FRAME_HEIGHT_SCRIPT}
     </body>
     </html>
     """
 
-    n_sections = sum(1 for p in pitches if similar_pitches.get(p.get("pitch_type", "")))
-    height = n_sections * 380
-    components.html(html, height=height, scrolling=True)
+    height = 150 + n_rows * 90 + (70 if detailed_html else 0)
+    return html, height
 
 
 def render_pitch_model(
@@ -714,9 +757,6 @@ def render_pitch_model(
         st.warning("No pitch data available for this pitcher/season.")
         return
 
-    # Section 1: Screenshot-friendly arsenal overview
-    _render_arsenal_overview(pitcher_info, pitches, similar_pitches)
-
-    # Section 2: Detailed comparisons
-    st.markdown("### Detailed Comparisons")
-    _render_detailed_comps(pitches, similar_pitches)
+    # Arsenal overview and detailed comparisons share one iframe
+    html, height = _build_pitch_model_html(pitcher_info, pitches, similar_pitches)
+    components.html(html, height=height, scrolling=True)
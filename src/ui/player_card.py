@@ -1,6 +1,6 @@
 """Player card component for displaying player stats."""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import streamlit as st
 
 from ..metrics.definitions import (
@@ -25,13 +25,13 @@ class PlayerCard:
 
     def _format_metric(self, metric_name: str, value: Any) -> str:
         """Format a metric value for display."""
-        if value is None or (isinstance(value, float) and str(value) == "nan"):
+        if value is None or (isinstance(value, float) and value != value):
             return "—"
 
-        if metric_name in METRIC_DEFINITIONS:
-            definition = METRIC_DEFINITIONS[metric_name]
+        definition = METRIC_DEFINITIONS.get(metric_name)
+        if definition is not None:
             try:
-                formatted = definition.format_str.format(value)
+                formatted = definition.formatter(value)
                 return f"{formatted}{definition.suffix}"
             except (ValueError, TypeError):
                 return str(value)
@@ -45,8 +45,9 @@ class PlayerCard:
 
     def _get_display_name(self, metric_name: str) -> str:
         """Get the display name for a metric."""
-        if metric_name in METRIC_DEFINITIONS:
-            return METRIC_DEFINITIONS[metric_name].display_name
+        definition = METRIC_DEFINITIONS.get(metric_name)
+        if definition is not None:
+            return definition.display_name
         return metric_name.replace("_", " ").title()
 
     def render(self, show_similarity: Optional[float] = None) -> None:
@@ -59,42 +60,39 @@ class PlayerCard:
         name = self.data.get("name", "Unknown Player")
         season = self.data.get("season", "")
 
-        st.markdown(f"### {name} ({season})")
+        # Collected into one markdown block so the card is a single element
+        lines = [f"### {name} ({season})"]
 
         if show_similarity is not None:
-            st.markdown(f"**Similarity: {show_similarity:.1f}%**")
+            lines.append(f"**Similarity: {show_similarity:.1f}%**")
 
-        st.markdown("---")
+        lines.append("---")
 
-        st.markdown("**Batted Ball Quality**")
-        for metric in BATTED_BALL_METRICS:
-            if metric in self.data:
-                display_name = self._get_display_name(metric)
-                formatted_value = self._format_metric(metric, self.data[metric])
-                st.markdown(f"{display_name}: {formatted_value}")
+        lines.append("**Batted Ball Quality**")
+        self._append_metric_lines(lines, BATTED_BALL_METRICS)
 
-        st.markdown("")
-        st.markdown("**Plate Discipline**")
-        for metric in PLATE_DISCIPLINE_METRICS:
-            if metric in self.data:
-                display_name = self._get_display_name(metric)
-                formatted_value = self._format_metric(metric, self.data[metric])
-                st.markdown(f"{display_name}: {formatted_value}")
+        lines.append("**Plate Discipline**")
+        self._append_metric_lines(lines, PLATE_DISCIPLINE_METRICS)
 
         if any(m in self.data for m in BATTED_BALL_PROFILE_METRICS):
-            st.markdown("")
-            st.markdown("**Batted Ball Profile**")
-            for metric in BATTED_BALL_PROFILE_METRICS:
-                if metric in self.data:
-                    display_name = self._get_display_name(metric)
-                    formatted_value = self._format_metric(metric, self.data[metric])
-                    st.markdown(f"{display_name}: {formatted_value}")
+            lines.append("**Batted Ball Profile**")
+            self._append_metric_lines(lines, BATTED_BALL_PROFILE_METRICS)
 
         if "xwoba" in self.data:
-            st.markdown("")
-            st.markdown("**Expected Stats**")
+            lines.append("**Expected Stats**")
             formatted_xwoba = self._format_metric("xwoba", self.data["xwoba"])
-            st.markdown(f"xwOBA: {formatted_xwoba}")
+            lines.append(f"xwOBA: {formatted_xwoba}")
+
+        st.markdown("\n\n".join(lines))
+
+    def _append_metric_lines(self, lines: List[str], metrics: List[str]) -> None:
+        """Append a "Name: value" line for each metric present in the data."""
+        data = self.data
+        for metric in metrics:
+            if metric in data:
+                display_name = self._get_display_name(metric)
+                formatted_value = self._format_metric(metric, data[metric])
+                lines.append(f"{display_name}: {formatted_value}")
 
 
 def render_player_card(
@@ -1,5 +1,30 @@
 """Custom CSS styles for the app."""
 
+# Font tags for the components.html iframes. Preconnecting to the font file
+# host lets the DNS/TLS handshake overlap with fetching the stylesheet, and
+# the print-media swap keeps the stylesheet from blocking first paint (text
+# shows in the fallback font until DM Sans arrives).
+_FONT_CSS_URL = (
+    "https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;600;700"
+    "&family=DM+Serif+Display&display=swap"
+)
+FONT_LINK = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com">'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+    f'<link rel="preload" as="style" href="{_FONT_CSS_URL}">'
+    f'<link rel="stylesheet" href="{_FONT_CSS_URL}" media="print" onload="this.media=\'all\'">'
+)
+
+# Resizes a components.html iframe to its content. ResizeObserver fires on
+# first layout and again whenever the body changes size (late font swaps,
+# viewport resizes), so no timed re-checks are needed.
+FRAME_HEIGHT_SCRIPT = """<script>
+            new ResizeObserver(function () {
+                var h = document.documentElement.scrollHeight;
+                window.parent.postMessage({type: "streamlit:setFrameHeight", height: h}, "*");
+            }).observe(document.body);
+        </script>"""
+
 CUSTOM_CSS = """
 <style>
 /* Clean, Claude-like base styling */